@@ -1,6 +1,16 @@
 import re
+from functools import lru_cache
 
+# Boundaries where to_snake_case inserts an underscore: before a capitalized
+# word ("HTTPResponse" -> "HTTP_Response") and between a lowercase letter or
+# digit and an uppercase letter ("thisIs" -> "this_Is").
+CAPITALIZED_WORD_PATTERN = re.compile(r"(.)([A-Z][a-z]+)")
+LOWER_UPPER_BOUNDARY_PATTERN = re.compile(r"([a-z0-9])([A-Z])")
 
+
+# Pydantic calls the alias generator for every field of every schema class, and
+# the same field names (id, created_at, ...) recur across many models.
+@lru_cache(maxsize=1024)
 def to_camel_case(string: str) -> str:
     """Convert a snake_case string to camelCase.
 
@@ -63,6 +73,6 @@ def to_snake_case(camel_str: str) -> str:
     str
         The converted string in snake_case format.
     """
-    snake_with_caps = re.sub("(.)([A-Z][a-z]+)", r"\1_\2", camel_str)
+    snake_with_caps = CAPITALIZED_WORD_PATTERN.sub(r"\1_\2", camel_str)
 
-    return re.sub("([a-z0-9])([A-Z])", r"\1_\2", snake_with_caps).lower()
+    return LOWER_UPPER_BOUNDARY_PATTERN.sub(r"\1_\2", snake_with_caps).lower()
@@ -6,13 +6,12 @@ from uuid import UUID, uuid4
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload, selectinload
 
 from app.core.database_async import get_async_session
 from app.core.logger import _setup_custom_logger
 from app.features.assistant.orchestrator import generate_simulation_summary
 from app.features.assistant.schemas import SimulationSummaryResponse
-from app.features.simulation.models import Case, Simulation
+from app.features.simulation.models import Simulation
 from app.features.user.manager import optional_current_user
 from app.features.user.models import User
 
@@ -41,12 +40,7 @@ async def summarize_simulation(
 
     stmt = (
         select(Simulation)
-        .options(
-            joinedload(Simulation.case).joinedload(Case.machine),
-            joinedload(Simulation.case).selectinload(Case.links),
-            selectinload(Simulation.artifacts),
-            selectinload(Simulation.links),
-        )
+        .options(*Simulation.core_options())
         .where(Simulation.id == sim_id)
     )
     result = await db.execute(stmt)
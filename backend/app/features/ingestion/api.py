@@ -4,7 +4,7 @@ from collections import defaultdict
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, NoReturn
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from fastapi import (
     APIRouter,
@@ -381,7 +381,9 @@ def ingest_from_upload(
             )
 
         if ingest_result.errors:
-            _raise_archive_validation_error(ingest_result.errors)
+            _raise_archive_validation_error(
+                [error.to_dict() for error in ingest_result.errors]
+            )
 
         response = _process_ingestion(
             ingest_result=ingest_result,
@@ -882,7 +884,7 @@ def _process_ingestion(
         created_count=ingest_result.created_count,
         duplicate_count=ingest_result.duplicate_count,
         simulations=_build_ingestion_simulation_summaries(created_sims, db),
-        errors=ingest_result.errors,
+        errors=[error.to_dict() for error in ingest_result.errors],
     )
 
 
@@ -921,8 +923,13 @@ def _persist_simulations(
     hpc_username : str | None, optional
         HPC username for provenance (trusted, informational only)
     """
+    if not simulations:
+        return []
+
     now = datetime.now(timezone.utc)
-    created_sims: list[Simulation] = []
+    simulation_rows: list[dict[str, Any]] = []
+    artifact_rows: list[tuple[UUID, UUID, str, str, str | None]] = []
+    link_rows: list[dict[str, Any]] = []
 
     for sim_create in simulations:
         data = sim_create.model_dump(
@@ -934,40 +941,81 @@ def _persist_simulations(
         if data.get("git_repository_url") is not None:
             data["git_repository_url"] = str(data["git_repository_url"])
 
-        sim = Simulation(
-            **data,
-            ingestion_id=ingestion_id,
-            created_by=user.id,
-            last_updated_by=user.id,
-            created_at=now,
-            updated_at=now,
+        # Assign IDs up front so child rows can reference their simulation
+        # without a per-row flush.
+        simulation_id = uuid4()
+        simulation_rows.append(
+            {
+                **data,
+                "id": simulation_id,
+                "ingestion_id": ingestion_id,
+                "created_by": user.id,
+                "last_updated_by": user.id,
+                "created_at": now,
+                "updated_at": now,
+            }
         )
 
-        if sim_create.artifacts:
-            for artifact in sim_create.artifacts:
-                artifact_data = artifact.model_dump(
-                    by_alias=False,
-                    exclude_unset=True,
+        for artifact in sim_create.artifacts or []:
+            artifact_rows.append(
+                (
+                    uuid4(),
+                    simulation_id,
+                    artifact.kind.value,
+                    str(artifact.uri),
+                    artifact.label,
                 )
-                artifact_data["uri"] = str(artifact.uri)
-                sim.artifacts.append(Artifact(**artifact_data))
-
-        if sim_create.links:
-            for link in sim_create.links:
-                link_data = link.model_dump(
-                    by_alias=False,
-                    exclude_unset=True,
-                )
-                link_data["url"] = str(link.url)
-                sim.links.append(ExternalLink(**link_data))
+            )
 
-        db.add(sim)
-        created_sims.append(sim)
+        for link in sim_create.links or []:
+            link_data = link.model_dump(by_alias=False, exclude_unset=True)
+            link_data["url"] = str(link.url)
+            link_rows.append({**link_data, "simulation_id": simulation_id})
+
+    # ORM bulk INSERTs are sent as multi-row statements, paged by the engine's
+    # ``insertmanyvalues_page_size``.
+    created_sims = list(
+        db.scalars(
+            insert(Simulation).returning(Simulation, sort_by_parameter_order=True),
+            simulation_rows,
+        )
+    )
+    if artifact_rows:
+        _copy_artifact_rows(db, artifact_rows)
+    if link_rows:
+        db.execute(insert(ExternalLink), link_rows)
 
-    db.flush()
     return created_sims
 
 
+def _copy_artifact_rows(
+    db: Session, artifact_rows: list[tuple[UUID, UUID, str, str, str | None]]
+) -> None:
+    """Bulk-load artifact rows with ``COPY FROM STDIN``.
+
+    Artifacts are append-only during ingestion and nothing reads them back,
+    so they are streamed through psycopg's COPY protocol on the session's
+    connection (and transaction) instead of going through the ORM.
+    Timestamps fall back to their server defaults.
+
+    Parameters
+    ----------
+    db : Session
+        Active SQLAlchemy database session used for persistence.
+    artifact_rows : list[tuple[UUID, UUID, str, str, str | None]]
+        ``(id, simulation_id, kind, uri, label)`` tuples to load.
+    """
+    dbapi_connection = db.connection().connection
+
+    with dbapi_connection.cursor() as cursor:
+        with cursor.copy(
+            f"COPY {Artifact.__tablename__} (id, simulation_id, kind, uri, label) "
+            "FROM STDIN"
+        ) as copy:
+            for row in artifact_rows:
+                copy.write_row(row)
+
+
 def _build_ingestion_simulation_summaries(
     created_sims: list[Simulation], db: Session
 ) -> list[IngestionSimulationSummary]:
@@ -1,32 +1,104 @@
 """Module for ingesting simulation archives and mapping to DB schemas."""
 
 import shlex
+import threading
+import time as time_module
+from collections.abc import Mapping
 from dataclasses import dataclass, field, replace
 from datetime import date, datetime, time, timezone
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
 from typing import Literal
 from uuid import UUID
 
 from dateutil import parser as dateutil_parser
 from pydantic import HttpUrl, TypeAdapter, ValidationError
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.common.utils import _normalize_hpc_username
 from app.core.logger import _setup_custom_logger
 from app.features.ingestion.parsers.parser import main_parser
 from app.features.ingestion.parsers.types import ParsedSimulation
-from app.features.machine.utils import parse_machine_name, resolve_machine_by_name
+from app.features.machine.models import Machine
+from app.features.machine.utils import canonicalize_machine_name, parse_machine_name
 from app.features.simulation.enums import ArtifactKind, SimulationStatus, SimulationType
 from app.features.simulation.models import Case, Simulation
 from app.features.simulation.schemas import ArtifactCreate, SimulationCreate
 
 logger = _setup_custom_logger(__name__)
 
+MACHINE_ID_CACHE_TTL_SECONDS = 300.0
+
+# Machines are reference data, so resolved IDs are shared across ingest calls.
+# Only hits are cached; unknown names are looked up again on the next ingest.
+_MACHINE_ID_CACHE_LOCK = threading.Lock()
+_MACHINE_ID_CACHE: dict[str, tuple[float, UUID]] = {}
+
 _STRING_ADAPTER = TypeAdapter(str)
 _DATE_ADAPTER = TypeAdapter(date)
 _DATETIME_ADAPTER = TypeAdapter(datetime)
 _HTTP_URL_ADAPTER = TypeAdapter(HttpUrl)
 CaseIdentity = tuple[str, UUID, str]
+# (case name, machine id bytes, HPC username, execution id). Kept to primitive
+# values so set membership hashes cheaply across large archives.
+ExecutionKey = tuple[str, bytes, str, str]
+
+# ParsedSimulation fields copied into SimulationCreateDraft without conversion.
+_PASSTHROUGH_DRAFT_FIELDS: tuple[str, ...] = (
+    "execution_id",
+    "compset",
+    "compset_alias",
+    "grid_name",
+    "grid_resolution",
+    "campaign",
+    "experiment_type",
+    "initialization_type",
+    "compiler",
+    "git_branch",
+    "git_tag",
+    "git_commit_hash",
+    "case_hash",
+)
+_get_passthrough_draft_values = attrgetter(*_PASSTHROUGH_DRAFT_FIELDS)
+
+# Enum members keyed by value and by member name, resolved once at import.
+_SIMULATION_TYPE_LOOKUP: dict[str, SimulationType] = {
+    **{member.name: member for member in SimulationType},
+    **{member.value: member for member in SimulationType},
+}
+_SIMULATION_STATUS_LOOKUP: dict[str, SimulationStatus] = {
+    **{member.name: member for member in SimulationStatus},
+    **{member.value: member for member in SimulationStatus},
+}
+
+
+@dataclass(frozen=True, slots=True)
+class IngestError:
+    """A simulation that failed to ingest.
+
+    Attributes
+    ----------
+    execution_dir : str
+        Execution directory the failing simulation was parsed from.
+    error_type : str
+        Exception class name raised while processing the simulation.
+    error : str
+        Human-readable error message.
+    """
+
+    execution_dir: str
+    error_type: str
+    error: str
+
+    def to_dict(self) -> dict[str, str]:
+        """Return the JSON-serializable form used in API responses."""
+        return {
+            "execution_dir": self.execution_dir,
+            "error_type": self.error_type,
+            "error": self.error,
+        }
 
 
 @dataclass
@@ -45,7 +117,7 @@ class IngestArchiveResult:
         Number of simulations skipped due to existing records in the database.
     skipped_count : int
         Number of incomplete runs that were skipped at the parser level.
-    errors : list[dict[str, str]]
+    errors : list[IngestError]
         List of ingestion errors encountered during processing.
     """
 
@@ -53,7 +125,7 @@ class IngestArchiveResult:
     created_count: int
     duplicate_count: int
     skipped_count: int = 0
-    errors: list[dict[str, str]] = field(default_factory=list)
+    errors: list[IngestError] = field(default_factory=list)
 
 
 @dataclass(frozen=True)
@@ -114,12 +186,8 @@ def ingest_archive(
         Dataclass containing list of SimulationCreate objects, counts of
         created and duplicate simulations, and any errors encountered.
     """
-    archive_path_resolved = (
-        Path(archive_path) if isinstance(archive_path, str) else archive_path
-    )
-    output_dir_resolved = (
-        Path(output_dir) if isinstance(output_dir, str) else output_dir
-    )
+    archive_path_resolved = Path(archive_path)
+    output_dir_resolved = Path(output_dir)
 
     parsed_simulations, skipped_count = main_parser(
         archive_path_resolved,
@@ -139,15 +207,21 @@ def ingest_archive(
 
     simulations: list[SimulationCreate] = []
     duplicate_count = 0
-    errors: list[dict[str, str]] = []
+    errors: list[IngestError] = []
     case_hash_cache: dict[CaseIdentity, str] = {}
     persisted_case_hash_cache: dict[UUID, str | None] = {}
+    machine_ids = _load_machine_ids(
+        db, {sim.machine for sim in parsed_simulations if sim.machine}
+    )
+    existing_execution_keys = _load_existing_execution_keys(parsed_simulations, db)
 
     for parsed_simulation in parsed_simulations:
         try:
             simulation, is_duplicate = _process_simulation_for_ingest(
                 parsed_simulation=parsed_simulation,
                 db=db,
+                machine_ids=machine_ids,
+                existing_execution_keys=existing_execution_keys,
                 case_hash_cache=case_hash_cache,
                 persisted_case_hash_cache=persisted_case_hash_cache,
                 request_hpc_username=hpc_username,
@@ -168,11 +242,11 @@ def ingest_archive(
             )
 
             errors.append(
-                {
-                    "execution_dir": parsed_simulation.execution_dir,
-                    "error_type": type(e).__name__,
-                    "error": str(e),
-                }
+                IngestError(
+                    execution_dir=parsed_simulation.execution_dir,
+                    error_type=type(e).__name__,
+                    error=str(e),
+                )
             )
             continue
 
@@ -190,6 +264,8 @@ def ingest_archive(
 def _process_simulation_for_ingest(
     parsed_simulation: ParsedSimulation,
     db: Session,
+    machine_ids: Mapping[str, UUID],
+    existing_execution_keys: set[ExecutionKey],
     case_hash_cache: dict[CaseIdentity, str],
     persisted_case_hash_cache: dict[UUID, str | None],
     request_hpc_username: str | None = None,
@@ -202,6 +278,10 @@ def _process_simulation_for_ingest(
         Parsed archive-derived metadata for the simulation.
     db : Session
         Active database session for lookups and case resolution.
+    machine_ids : Mapping[str, UUID]
+        Machine IDs keyed by the machine names found in the archive.
+    existing_execution_keys : set[ExecutionKey]
+        Identity keys of executions already stored in the database.
     Returns
     -------
     tuple[SimulationCreate | None, bool]
@@ -211,26 +291,31 @@ def _process_simulation_for_ingest(
     """
     execution_id = parsed_simulation.execution_id
     case_name = _require_case_name(parsed_simulation)
-    machine_id = _resolve_machine_id(parsed_simulation, db)
+    machine_id = _resolve_machine_id(parsed_simulation, machine_ids)
     resolved_hpc_username = _resolve_case_hpc_username(
         parsed_simulation,
         request_hpc_username,
     )
 
+    execution_key = _execution_key(
+        case_name, machine_id, resolved_hpc_username, execution_id
+    )
+    if execution_key in existing_execution_keys:
+        logger.info(
+            "Simulation with case_name='%s' and execution_id='%s' already exists. "
+            "Skipping duplicate from %s.",
+            case_name,
+            execution_id,
+            parsed_simulation.execution_dir,
+        )
+        return None, True
+
     existing_case = _find_case(
         db,
         name=case_name,
         machine_id=machine_id,
         hpc_username=resolved_hpc_username,
     )
-    if existing_case is not None and _is_duplicate_simulation(
-        case=existing_case,
-        execution_id=execution_id,
-        execution_dir=parsed_simulation.execution_dir,
-        db=db,
-    ):
-        return None, True
-
     prevalidated_draft = _prevalidate_simulation_create(
         parsed_simulation,
     )
@@ -301,15 +386,14 @@ def _get_known_case_hash(
 ) -> str | None:
     """Return first known CASE_HASH used for within-case execution grouping."""
     if case.id not in persisted_case_hash_cache:
-        known_hash = (
-            db.query(Simulation.case_hash)
-            .filter(
+        known_hash = db.scalar(
+            select(Simulation.case_hash)
+            .where(
                 Simulation.case_id == case.id,
                 Simulation.case_hash.is_not(None),
             )
             .order_by(Simulation.created_at.asc())
             .limit(1)
-            .scalar()
         )
         persisted_case_hash_cache[case.id] = known_hash
         if known_hash is not None:
@@ -363,34 +447,50 @@ def _find_case(
     hpc_username: str,
 ) -> Case | None:
     """Return existing Case by normalized identity without creating one."""
-    return (
-        db.query(Case)
-        .filter(
+    return db.scalars(
+        select(Case)
+        .where(
             Case.name == name,
             Case.machine_id == machine_id,
             Case.hpc_username == hpc_username,
         )
-        .first()
-    )
-
+        .limit(1)
+    ).first()
 
-def _is_duplicate_simulation(
-    case: Case, execution_id: str, execution_dir: str, db: Session
-) -> bool:
-    """Return True when a simulation with the same case/execution already exists."""
-    existing_sim = _find_existing_simulation(db, case.id, execution_id)
 
-    if not existing_sim:
-        return False
+def _load_existing_execution_keys(
+    parsed_simulations: list[ParsedSimulation], db: Session
+) -> set[ExecutionKey]:
+    """Return identity keys of stored executions that may collide with the archive.
 
-    logger.info(
-        "Simulation with case_name='%s' and execution_id='%s' already exists. "
-        "Skipping duplicate from %s.",
-        case.name,
-        execution_id,
-        execution_dir,
+    A single query fetches every stored ``(case, execution_id)`` pair whose case
+    name and execution id both appear in the archive, replacing one duplicate
+    lookup per parsed simulation.
+    """
+    case_names = {sim.case_name for sim in parsed_simulations if sim.case_name}
+    if not case_names:
+        return set()
+
+    execution_ids = {sim.execution_id for sim in parsed_simulations}
+    rows = db.execute(
+        select(Case.name, Case.machine_id, Case.hpc_username, Simulation.execution_id)
+        .join(Simulation, Simulation.case_id == Case.id)
+        .where(
+            Case.name.in_(case_names),
+            Simulation.execution_id.in_(execution_ids),
+        )
     )
-    return True
+
+    return {
+        _execution_key(name, machine_id, hpc_username, execution_id)
+        for name, machine_id, hpc_username, execution_id in rows
+    }
+
+
+def _execution_key(
+    case_name: str, machine_id: UUID, hpc_username: str, execution_id: str
+) -> ExecutionKey:
+    return (case_name, machine_id.bytes, hpc_username, execution_id)
 
 
 def _build_simulation_create(
@@ -448,10 +548,14 @@ def _build_path_artifacts(parsed_simulation: ParsedSimulation) -> list[ArtifactC
 def _append_path_artifact(
     artifacts: list[ArtifactCreate], kind: ArtifactKind, uri: str | None
 ) -> None:
-    if uri is None:
+    # Path artifacts are derived internally from a known kind and a stripped,
+    # non-empty URI, which is exactly what ArtifactCreate's validators enforce,
+    # so the validated constructor can be skipped.
+    normalized_uri = _normalize_path_candidate(uri)
+    if normalized_uri is None:
         return
 
-    artifacts.append(ArtifactCreate(kind=kind, uri=uri))
+    artifacts.append(ArtifactCreate.model_construct(kind=kind, uri=normalized_uri))
 
 
 def _derive_case_run_script_path(case_root: str | None) -> str | None:
@@ -612,16 +716,85 @@ def _resolve_case_hpc_username(
     )
 
 
-def _resolve_machine_id(metadata: ParsedSimulation, db: Session) -> UUID:
-    """Resolve machine name to machine ID from the database.
+def _load_machine_ids(db: Session, names: set[str]) -> dict[str, UUID]:
+    """Resolve archive machine names to machine IDs with at most one query.
+
+    Canonical names resolved within the last ``MACHINE_ID_CACHE_TTL_SECONDS``
+    are served from a process-wide cache; the rest are fetched together.
+
+    Parameters
+    ----------
+    db : Session
+        Active database session for querying the Machine table.
+    names : set[str]
+        Machine names as they appear in the archive, including known aliases.
+
+    Returns
+    -------
+    dict[str, UUID]
+        Machine IDs keyed by the original archive machine name. Names that do
+        not match a stored machine are omitted.
+    """
+    if not names:
+        return {}
+
+    canonical_names = {name: canonicalize_machine_name(name) for name in names}
+    ids_by_canonical_name = _get_cached_machine_ids(set(canonical_names.values()))
+
+    missing_names = set(canonical_names.values()) - ids_by_canonical_name.keys()
+    if missing_names:
+        rows = db.execute(
+            select(Machine.name, Machine.id).where(Machine.name.in_(missing_names))
+        )
+        fetched_ids = {name: machine_id for name, machine_id in rows}
+        _set_cached_machine_ids(fetched_ids)
+        ids_by_canonical_name.update(fetched_ids)
+
+    return {
+        name: ids_by_canonical_name[canonical_name]
+        for name, canonical_name in canonical_names.items()
+        if canonical_name in ids_by_canonical_name
+    }
+
+
+def _get_cached_machine_ids(canonical_names: set[str]) -> dict[str, UUID]:
+    now = time_module.monotonic()
+    cached_ids: dict[str, UUID] = {}
+    with _MACHINE_ID_CACHE_LOCK:
+        for name in canonical_names:
+            cached_entry = _MACHINE_ID_CACHE.get(name)
+            if cached_entry is None:
+                continue
+
+            expires_at, machine_id = cached_entry
+            if expires_at <= now:
+                _MACHINE_ID_CACHE.pop(name, None)
+                continue
+
+            cached_ids[name] = machine_id
+
+    return cached_ids
+
+
+def _set_cached_machine_ids(machine_ids: Mapping[str, UUID]) -> None:
+    expires_at = time_module.monotonic() + MACHINE_ID_CACHE_TTL_SECONDS
+    with _MACHINE_ID_CACHE_LOCK:
+        for name, machine_id in machine_ids.items():
+            _MACHINE_ID_CACHE[name] = (expires_at, machine_id)
+
+
+def _resolve_machine_id(
+    metadata: ParsedSimulation, machine_ids: Mapping[str, UUID]
+) -> UUID:
+    """Resolve machine name to machine ID from the preloaded machine map.
 
     Parameters
     ----------
     metadata : ParsedSimulation
         Parsed metadata for the simulation, expected to contain a
         "machine" key with the machine name.
-    db : Session
-        Active database session for querying the Machine table.
+    machine_ids : Mapping[str, UUID]
+        Machine IDs keyed by archive machine name, from ``_load_machine_ids``.
 
     Raises
     ------
@@ -634,47 +807,17 @@ def _resolve_machine_id(metadata: ParsedSimulation, db: Session) -> UUID:
     if not machine_name:
         raise ValueError("Machine name is required but not found in metadata")
 
-    machine = resolve_machine_by_name(db, machine_name)
-    if not machine:
+    machine_id = machine_ids.get(machine_name)
+    if machine_id is None:
         raise LookupError(
             f"Machine '{machine_name}' not found in database. "
             "Please ensure the machine exists before uploading."
         )
-    return machine.id
-
-
-def _find_existing_simulation(
-    db: Session, case_id: UUID, execution_id: str
-) -> Simulation | None:
-    """Find an existing simulation by case/execution pair.
-
-    Parameters
-    ----------
-    db : Session
-        Active database session for querying the Simulation table.
-    case_id : UUID
-        Case identifier paired with the execution identifier.
-    execution_id : str
-        Execution identifier derived from the timing-file LID.
-
-    Returns
-    -------
-    Simulation | None
-        The existing Simulation object with the given case/execution pair,
-        or None if not found.
-    """
-    result = (
-        db.query(Simulation)
-        .filter(
-            Simulation.case_id == case_id,
-            Simulation.execution_id == execution_id,
-        )
-        .first()
-    )
-
-    return result
+    return machine_id
 
 
+# Executions in an archive almost always share one repository URL.
+@lru_cache(maxsize=128)
 def _normalize_git_url(url: str | None) -> str | None:
     """Convert SSH git URL to HTTPS format.
 
@@ -732,8 +875,6 @@ def _build_simulation_create_draft(
     ----------
     parsed_simulation : ParsedSimulation
         Parsed archive-derived metadata with string values.
-    machine_id : UUID
-        Pre-extracted machine ID.
     case_id : UUID
         ID of the Case this simulation belongs to.
     Returns
@@ -751,32 +892,27 @@ def _build_simulation_create_draft(
     simulation_type = _normalize_simulation_type(None)
     status = _normalize_simulation_status(parsed_simulation.status)
     _, compute_type = parse_machine_name(parsed_simulation.machine or "")
+    passthrough_values = dict(
+        zip(
+            _PASSTHROUGH_DRAFT_FIELDS,
+            _get_passthrough_draft_values(parsed_simulation),
+            strict=True,
+        )
+    )
 
     simulation_draft = SimulationCreateDraft(
+        **passthrough_values,
         case_id=case_id,
-        execution_id=parsed_simulation.execution_id,
-        compset=parsed_simulation.compset,
-        compset_alias=parsed_simulation.compset_alias,
-        grid_name=parsed_simulation.grid_name,
-        grid_resolution=parsed_simulation.grid_resolution,
         simulation_type=simulation_type,
         status=status,
-        campaign=parsed_simulation.campaign,
-        experiment_type=parsed_simulation.experiment_type,
-        initialization_type=parsed_simulation.initialization_type,
         simulation_start_date=simulation_start_date,
         simulation_end_date=simulation_end_date,
         run_start_date=run_start_date,
         run_end_date=run_end_date,
-        compiler=parsed_simulation.compiler,
         compute_type=compute_type,
         git_repository_url=git_repository_url,
-        git_branch=parsed_simulation.git_branch,
-        git_tag=parsed_simulation.git_tag,
-        git_commit_hash=parsed_simulation.git_commit_hash,
         created_by=None,
         last_updated_by=None,
-        case_hash=parsed_simulation.case_hash,
     )
 
     return simulation_draft
@@ -800,18 +936,18 @@ def _normalize_simulation_type(value: str | None) -> SimulationType:
     if not normalized:
         return SimulationType.UNKNOWN
 
-    try:
-        return SimulationType(normalized)
-    except ValueError:
-        try:
-            return SimulationType[normalized.upper()]
-        except KeyError:
-            logger.warning(
-                "Unknown simulation_type '%s'; defaulting to '%s'.",
-                value,
-                SimulationType.UNKNOWN.value,
-            )
-            return SimulationType.UNKNOWN
+    simulation_type = _SIMULATION_TYPE_LOOKUP.get(normalized)
+    if simulation_type is None:
+        simulation_type = _SIMULATION_TYPE_LOOKUP.get(normalized.upper())
+    if simulation_type is None:
+        logger.warning(
+            "Unknown simulation_type '%s'; defaulting to '%s'.",
+            value,
+            SimulationType.UNKNOWN.value,
+        )
+        return SimulationType.UNKNOWN
+
+    return simulation_type
 
 
 def _normalize_simulation_status(value: str | None) -> SimulationStatus:
@@ -823,18 +959,18 @@ def _normalize_simulation_status(value: str | None) -> SimulationStatus:
     if not normalized:
         return SimulationStatus.CREATED
 
-    try:
-        return SimulationStatus(normalized)
-    except ValueError:
-        try:
-            return SimulationStatus[normalized.upper()]
-        except KeyError:
-            logger.warning(
-                "Unknown status '%s'; defaulting to '%s'.",
-                value,
-                SimulationStatus.CREATED.value,
-            )
-            return SimulationStatus.CREATED
+    status = _SIMULATION_STATUS_LOOKUP.get(normalized)
+    if status is None:
+        status = _SIMULATION_STATUS_LOOKUP.get(normalized.upper())
+    if status is None:
+        logger.warning(
+            "Unknown status '%s'; defaulting to '%s'.",
+            value,
+            SimulationStatus.CREATED.value,
+        )
+        return SimulationStatus.CREATED
+
+    return status
 
 
 def _parse_datetime_field(value: str | None) -> datetime | None:
@@ -853,8 +989,7 @@ def _parse_datetime_field(value: str | None) -> datetime | None:
     if not value:
         return None
     try:
-        # Try parsing with dateutil for flexibility
-        dt = dateutil_parser.parse(value)
+        dt = _parse_datetime_string(value)
         # Ensure timezone-aware (UTC if not specified)
         if dt.tzinfo is None:
             dt = dt.replace(tzinfo=timezone.utc)
@@ -871,7 +1006,13 @@ def _parse_date_field(value: str | None) -> date | None:
     if not value:
         return None
     try:
-        parsed = dateutil_parser.parse(value)
+        # Plain ``YYYY-MM-DD`` values are the common case and need no
+        # timezone normalization.
+        return date.fromisoformat(value)
+    except ValueError:
+        pass
+    try:
+        parsed = _parse_datetime_string(value)
         if parsed.tzinfo is None:
             parsed = parsed.replace(tzinfo=timezone.utc)
         parsed = parsed.astimezone(timezone.utc)
@@ -883,3 +1024,17 @@ def _parse_date_field(value: str | None) -> date | None:
         logger.warning(f"Could not parse date '{value}': {e}")
 
         return None
+
+
+def _parse_datetime_string(value: str) -> datetime:
+    """Parse a datetime string, trying the ISO 8601 fast path first.
+
+    Archive metadata is almost always ISO 8601 (``YYYY-MM-DD`` or
+    ``YYYY-MM-DDTHH:MM:SS[Z]``), which ``datetime.fromisoformat`` handles in C.
+    Other formats fall back to the more flexible (and much slower) dateutil
+    parser.
+    """
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return dateutil_parser.parse(value)
@@ -1,13 +1,16 @@
+import calendar
 import re
 import xml.etree.ElementTree as ET
-from datetime import datetime
+from datetime import date, datetime, timedelta
 from pathlib import Path
 
-from dateutil.relativedelta import relativedelta
-
 from app.features.ingestion.parsers.utils import _open_text
 from app.features.simulation.schemas import KNOWN_EXPERIMENT_TYPES
 
+PATH_VARIABLE_PATTERN = re.compile(
+    r"\$(?:{(?P<braced>CIME_OUTPUT_ROOT|CASE)}|(?P<plain>CIME_OUTPUT_ROOT|CASE)\b)"
+)
+
 
 def parse_env_case(env_case_path: str | Path) -> dict[str, str | None]:
     """Parse env_case.xml (plain or gzipped).
@@ -33,15 +36,18 @@ def parse_env_case(env_case_path: str | Path) -> dict[str, str | None]:
         - ``compset_alias``: Compset alias (``COMPSET``)
         - ``case_root``: Case root directory (``CASEROOT``)
     """
-    env_case_path = Path(env_case_path)
+    values = _extract_values_from_file(
+        env_case_path,
+        ("CASE", "CASE_HASH", "CASE_GROUP", "MACH", "REALUSER", "COMPSET", "CASEROOT"),
+    )
 
-    case_name = _extract_value_from_file(env_case_path, "CASE")
-    case_hash = _extract_value_from_file(env_case_path, "CASE_HASH")
-    case_group = _extract_value_from_file(env_case_path, "CASE_GROUP")
-    machine = _extract_value_from_file(env_case_path, "MACH")
-    user = _extract_value_from_file(env_case_path, "REALUSER")
-    compset_alias = _extract_value_from_file(env_case_path, "COMPSET")
-    case_root = _extract_value_from_file(env_case_path, "CASEROOT")
+    case_name = values["CASE"]
+    case_hash = values["CASE_HASH"]
+    case_group = values["CASE_GROUP"]
+    machine = values["MACH"]
+    user = values["REALUSER"]
+    compset_alias = values["COMPSET"]
+    case_root = values["CASEROOT"]
 
     # Extract metadata that requires special handling
     campaign, experiment_type = _extract_campaign_and_experiment_type(case_name)
@@ -73,18 +79,15 @@ def parse_env_build(env_build_path: str | Path) -> dict[str, str | None]:
         Dictionary with keys 'grid_resolution', 'compiler', 'mpilib',
         and 'cime_output_root' (str or None)
     """
-    env_build_path = Path(env_build_path)
-
-    grid_resolution = _extract_value_from_file(env_build_path, "GRID")
-    compiler = _extract_value_from_file(env_build_path, "COMPILER")
-    mpilib = _extract_value_from_file(env_build_path, "MPILIB")
-    cime_output_root = _extract_value_from_file(env_build_path, "CIME_OUTPUT_ROOT")
+    values = _extract_values_from_file(
+        env_build_path, ("GRID", "COMPILER", "MPILIB", "CIME_OUTPUT_ROOT")
+    )
 
     return {
-        "grid_resolution": grid_resolution,
-        "compiler": compiler,
-        "mpilib": mpilib,
-        "cime_output_root": cime_output_root,
+        "grid_resolution": values["GRID"],
+        "compiler": values["COMPILER"],
+        "mpilib": values["MPILIB"],
+        "cime_output_root": values["CIME_OUTPUT_ROOT"],
     }
 
 
@@ -109,16 +112,29 @@ def parse_env_run(env_run_path: str | Path) -> dict[str, str | None]:
         - ``archive_path``: Short-term archive root (``DOUT_S_ROOT``)
         - ``postprocessing_script``: Post-run script command (``POSTRUN_SCRIPT``)
     """
-    env_run_path = Path(env_run_path)
-    initialization_type = _extract_value_from_file(env_run_path, "RUN_TYPE")
-    run_start_date = _extract_value_from_file(env_run_path, "RUN_STARTDATE")
-    run_ref_date = _extract_value_from_file(env_run_path, "RUN_REFDATE")
-    stop_option = _extract_value_from_file(env_run_path, "STOP_OPTION")
-    stop_n = _extract_value_from_file(env_run_path, "STOP_N")
-    stop_date = _extract_value_from_file(env_run_path, "STOP_DATE")
-    output_path = _extract_value_from_file(env_run_path, "RUNDIR")
-    archive_path = _extract_value_from_file(env_run_path, "DOUT_S_ROOT")
-    postprocessing_script = _extract_value_from_file(env_run_path, "POSTRUN_SCRIPT")
+    values = _extract_values_from_file(
+        env_run_path,
+        (
+            "RUN_TYPE",
+            "RUN_STARTDATE",
+            "RUN_REFDATE",
+            "STOP_OPTION",
+            "STOP_N",
+            "STOP_DATE",
+            "RUNDIR",
+            "DOUT_S_ROOT",
+            "POSTRUN_SCRIPT",
+        ),
+    )
+    initialization_type = values["RUN_TYPE"]
+    run_start_date = values["RUN_STARTDATE"]
+    run_ref_date = values["RUN_REFDATE"]
+    stop_option = values["STOP_OPTION"]
+    stop_n = values["STOP_N"]
+    stop_date = values["STOP_DATE"]
+    output_path = values["RUNDIR"]
+    archive_path = values["DOUT_S_ROOT"]
+    postprocessing_script = values["POSTRUN_SCRIPT"]
 
     simulation_start_date = (
         run_ref_date if initialization_type == "branch" else run_start_date
@@ -140,61 +156,80 @@ def parse_env_run(env_run_path: str | Path) -> dict[str, str | None]:
     }
 
 
-def _extract_value_from_file(path: Path, entry_id: str) -> str | None:
-    """Extract the value of a specific entry from an XML file.
+def _extract_values_from_file(
+    path: str | Path, entry_ids: tuple[str, ...]
+) -> dict[str, str | None]:
+    """Extract the values of several entries from an XML file.
+
+    The file is read and parsed once, and its entries are scanned in a single
+    pass that stops once every requested entry has been found.
 
     Parameters
     ----------
-    path : Path
+    path : str or Path
         Path to the XML file (plain or .gz)
-    entry_id : str
-        The ID of the entry to extract
+    entry_ids : tuple[str, ...]
+        The IDs of the entries to extract
 
     Returns
     -------
-    str | None
-        The value of the entry, or None if not found
+    dict[str, str | None]
+        The value of each entry keyed by ID, or None if not found
     """
+    values: dict[str, str | None] = dict.fromkeys(entry_ids)
+
     try:
         text = _open_text(path)
     except (OSError, UnicodeDecodeError):
-        return None
+        return values
 
     try:
         root = ET.fromstring(text)
     except ET.ParseError:
-        return None
+        return values
 
-    return _find_entry_value(root, entry_id)
+    return _find_entry_values(root, values)
 
 
-def _find_entry_value(root, entry_id: str) -> str | None:
+def _find_entry_values(root, values: dict[str, str | None]) -> dict[str, str | None]:
     """
-    Search for <entry id="..." value="..." /> or <entry id="...">text</entry>.
+    Fill values from <entry id="..." value="..." /> or <entry id="...">text</entry>.
 
     Parameters
     ----------
     root : Element
         The root element of the XML tree
-    entry_id : str
-        The ID of the entry to find
+    values : dict[str, str | None]
+        Requested entry IDs mapped to None; filled in place with the first
+        value found for each ID
 
     Returns
     -------
-    str | None
-        The value of the entry, or None if not found
+    dict[str, str | None]
+        The same mapping, with the value of each entry, or None if not found
     """
+    remaining = set(values)
+
     for entry in root.iter("entry"):
-        if entry.attrib.get("id") == entry_id:
-            # Prefer value attribute if present
-            if "value" in entry.attrib:
-                return entry.attrib["value"]
+        entry_id = entry.attrib.get("id")
+        if entry_id not in remaining:
+            continue
+
+        # Prefer value attribute if present
+        if "value" in entry.attrib:
+            value = entry.attrib["value"]
+        # Otherwise, use text content if present and non-empty
+        elif entry.text and entry.text.strip():
+            value = entry.text.strip()
+        else:
+            continue
 
-            # Otherwise, use text content if present and non-empty
-            if entry.text and entry.text.strip():
-                return entry.text.strip()
+        values[entry_id] = value
+        remaining.discard(entry_id)
+        if not remaining:
+            break
 
-    return None
+    return values
 
 
 def _extract_campaign_and_experiment_type(
@@ -218,7 +253,8 @@ def _extract_campaign_and_experiment_type(
     # Example: v3.LR.historical
     if case_name:
         # Remove trailing instance suffix like _0121
-        base = re.sub(r"_\d+$", "", case_name)
+        head, sep, suffix = case_name.rpartition("_")
+        base = head if sep and suffix.isdecimal() else case_name
 
         # Only infer campaign for dot-delimited case names.
         # Timing files sometimes use short case names (e.g., e3sm_v1_ne30)
@@ -246,16 +282,12 @@ def _substitute_path_variables(
     if path is None:
         return None
 
-    pattern = re.compile(
-        r"\$(?:{(?P<braced>CIME_OUTPUT_ROOT|CASE)}|(?P<plain>CIME_OUTPUT_ROOT|CASE)\b)"
-    )
-
     def replace(match: re.Match[str]) -> str:
         variable_name = match.group("braced") or match.group("plain")
         value = variables.get(variable_name)
         return value if value is not None else match.group(0)
 
-    return pattern.sub(replace, path)
+    return PATH_VARIABLE_PATTERN.sub(replace, path)
 
 
 def _calculate_simulation_end_date(
@@ -277,21 +309,35 @@ def _calculate_simulation_end_date(
         return None
 
     try:
-        start_date = datetime.strptime(simulation_start_date, "%Y-%m-%d")
+        # RUN_STARTDATE/RUN_REFDATE are ISO ``YYYY-MM-DD`` dates.
+        start_date = date.fromisoformat(simulation_start_date)
         stop_n_int = int(stop_n)
     except ValueError:
         return None
 
-    if stop_option == "ndays":
-        end_date = start_date + relativedelta(days=stop_n_int)
-    elif stop_option == "nmonths":
-        end_date = start_date + relativedelta(months=stop_n_int)
-    elif stop_option == "nyears":
-        end_date = start_date + relativedelta(years=stop_n_int)
-    else:
+    try:
+        if stop_option == "ndays":
+            end_date = start_date + timedelta(days=stop_n_int)
+        elif stop_option == "nmonths":
+            end_date = _add_months(start_date, stop_n_int)
+        elif stop_option == "nyears":
+            end_date = _add_months(start_date, stop_n_int * 12)
+        else:
+            return None
+    except (ValueError, OverflowError):
         return None
 
-    return end_date.strftime("%Y-%m-%d")
+    return end_date.isoformat()
+
+
+def _add_months(start_date: date, months: int) -> date:
+    """Add calendar months, clamping the day to the end of the target month."""
+    month_index = start_date.month - 1 + months
+    year = start_date.year + month_index // 12
+    month = month_index % 12 + 1
+    day = min(start_date.day, calendar.monthrange(year, month)[1])
+
+    return date(year, month, day)
 
 
 def _parse_stop_date(stop_date: str | None) -> str | None:
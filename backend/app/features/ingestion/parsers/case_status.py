@@ -2,7 +2,7 @@ import re
 from pathlib import Path
 
 from app.core.logger import _setup_custom_logger
-from app.features.ingestion.parsers.utils import _open_text
+from app.features.ingestion.parsers.utils import _open_text_lines
 from app.features.simulation.enums import SimulationStatus
 
 logger = _setup_custom_logger(__name__)
@@ -23,45 +23,45 @@ def parse_case_status(file_path: str | Path) -> dict[str, str | None]:
     latest ``case.run starting`` entry is treated as authoritative and the first
     terminal entry after it determines the run status.
     """
-    file_path = Path(file_path)
     result: dict[str, str | None] = {
         "run_start_date": None,
         "run_end_date": None,
         "status": SimulationStatus.UNKNOWN.value,
     }
 
+    latest_start_timestamp: str | None = None
+    terminal_match: re.Match[str] | None = None
+
     try:
-        lines = _open_text(file_path).splitlines()
+        for line in _open_text_lines(file_path):
+            stripped = line.strip()
+
+            start_match = CASE_RUN_START_PATTERN.match(stripped)
+            if start_match:
+                # A newer attempt supersedes any outcome recorded so far.
+                latest_start_timestamp = start_match.group("timestamp")
+                terminal_match = None
+                continue
+
+            if latest_start_timestamp is not None and terminal_match is None:
+                terminal_match = CASE_RUN_TERMINAL_PATTERN.match(stripped)
     except (OSError, UnicodeDecodeError) as exc:
         logger.warning("Failed to read case status file %s (%s)", file_path, exc)
         return result
 
-    latest_start_index: int | None = None
-    latest_start_timestamp: str | None = None
-
-    for index, line in enumerate(lines):
-        start_match = CASE_RUN_START_PATTERN.match(line.strip())
-        if start_match:
-            latest_start_index = index
-            latest_start_timestamp = start_match.group("timestamp")
-
-    if latest_start_index is None or latest_start_timestamp is None:
+    if latest_start_timestamp is None:
         return result
 
     result["run_start_date"] = latest_start_timestamp
 
-    for line in lines[latest_start_index + 1 :]:
-        terminal_match = CASE_RUN_TERMINAL_PATTERN.match(line.strip())
-        if not terminal_match:
-            continue
-
-        result["run_end_date"] = terminal_match.group("timestamp")
-        result["status"] = (
-            SimulationStatus.COMPLETED.value
-            if terminal_match.group("state") == "success"
-            else SimulationStatus.FAILED.value
-        )
+    if terminal_match is None:
+        result["status"] = SimulationStatus.RUNNING.value
         return result
 
-    result["status"] = SimulationStatus.RUNNING.value
+    result["run_end_date"] = terminal_match.group("timestamp")
+    result["status"] = (
+        SimulationStatus.COMPLETED.value
+        if terminal_match.group("state") == "success"
+        else SimulationStatus.FAILED.value
+    )
     return result
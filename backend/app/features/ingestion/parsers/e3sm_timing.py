@@ -1,9 +1,23 @@
 import re
+from collections.abc import Iterable
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
 
-from app.features.ingestion.parsers.utils import _open_text
+from app.features.ingestion.parsers.utils import _open_text_lines
+
+# Timing-file line labels (the text before ``:`` or ``=``) and the fields
+# they populate.
+_TIMING_FIELD_LABELS: dict[str, str] = {
+    "LID": "execution_id",
+    "Curr Date": "curr_date",
+    "Init Time": "init_time",
+    "Run Time": "run_time",
+    "Final Time": "final_time",
+}
+# Format of the "Curr Date" timing line, e.g. "Thu Dec 18 20:54:58 2025".
+_CURR_DATE_FORMAT = "%a %b %d %H:%M:%S %Y"
+_SECONDS_PATTERN = re.compile(r"(-?\d+(?:\.\d+)?)")
 
 
 def parse_e3sm_timing(path: str | Path) -> dict[str, Any]:
@@ -19,7 +33,6 @@ def parse_e3sm_timing(path: str | Path) -> dict[str, Any]:
     dict
         Dictionary with execution and run timing metadata.
     """
-    path = Path(path)
     result: dict[str, str | None] = {
         "execution_id": None,
         "run_start_date": None,
@@ -27,17 +40,15 @@ def parse_e3sm_timing(path: str | Path) -> dict[str, Any]:
     }
 
     try:
-        text = _open_text(path)
+        fields = _extract_fields(_open_text_lines(path), _TIMING_FIELD_LABELS)
     except (OSError, UnicodeDecodeError):
         return result
 
-    lines = text.splitlines()
-
-    execution_id = _extract(lines, r"LID\s*[:=]\s*(.+)")
-    curr_date = _parse_curr_date(_extract(lines, r"Curr Date\s*[:=]\s*(.+)"))
-    init_time = _parse_seconds(_extract(lines, r"Init Time\s*[:=]\s*(.+)"))
-    run_time = _parse_seconds(_extract(lines, r"Run Time\s*[:=]\s*(.+)"))
-    final_time = _parse_seconds(_extract(lines, r"Final Time\s*[:=]\s*(.+)"))
+    execution_id = fields.get("execution_id")
+    curr_date = _parse_curr_date(fields.get("curr_date"))
+    init_time = _parse_seconds(fields.get("init_time"))
+    run_time = _parse_seconds(fields.get("run_time"))
+    final_time = _parse_seconds(fields.get("final_time"))
 
     result["execution_id"] = execution_id
     if curr_date is not None:
@@ -62,35 +73,51 @@ def _parse_curr_date(date_str: str | None) -> datetime | None:
         return None
 
     try:
-        return datetime.strptime(date_str, "%a %b %d %H:%M:%S %Y")
+        return datetime.strptime(date_str, _CURR_DATE_FORMAT)
     except ValueError:
         return None
 
 
-def _extract(lines: list[str], pattern: str, group: int = 1) -> str | None:
-    """Extract the first regex group matching a pattern from a list of lines.
+def _extract_fields(lines: Iterable[str], labels: dict[str, str]) -> dict[str, str]:
+    """Extract the first ``label : value`` entry for each field in one pass.
 
     Parameters
     ----------
-    lines : list of str
-        Lines to search.
-    pattern : str
-        Regex pattern to match.
-    group : int, optional
-        Group number to extract (default is 1).
+    lines : iterable of str
+        Lines to search. Iteration stops early, so a lazy line reader only
+        reads up to the last field it needs.
+    labels : dict
+        Field names keyed by the label that precedes the first ``:`` or
+        ``=`` on a line.
 
     Returns
     -------
-    str or None
-        The matched group, or None if not found.
+    dict
+        Non-empty values keyed by field name. Scanning stops once every
+        field has been found.
     """
+    fields: dict[str, str] = {}
+
     for line in lines:
-        m = re.match(pattern, line.strip())
+        label, sep, value = line.partition(":")
+        if "=" in label:
+            label, sep, value = line.partition("=")
+
+        if not sep:
+            continue
+
+        key = labels.get(label.strip())
+        if key is None or key in fields:
+            continue
+
+        value = value.strip()
+        if value:
+            fields[key] = value
 
-        if m:
-            return m.group(group).strip()
+            if len(fields) == len(labels):
+                break
 
-    return None
+    return fields
 
 
 def _parse_seconds(value: str | None) -> float | None:
@@ -98,7 +125,7 @@ def _parse_seconds(value: str | None) -> float | None:
     if not value:
         return None
 
-    match = re.search(r"(-?\d+(?:\.\d+)?)", value)
+    match = _SECONDS_PATTERN.search(value)
     if not match:
         return None
 
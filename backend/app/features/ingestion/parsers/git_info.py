@@ -1,7 +1,15 @@
 import re
+from collections.abc import Iterable
 from pathlib import Path
 
-from app.features.ingestion.parsers.utils import _open_text
+from app.features.ingestion.parsers.utils import _open_text_lines
+
+GIT_DESCRIBE_PATTERN = re.compile(r"^(?P<tag>v[\w.\-]+)(?:-\d+)?-g(?P<hash>[0-9a-f]+)")
+GIT_DESCRIBE_TAG_PATTERN = re.compile(r"^([^-]+)")
+GIT_DESCRIBE_HASH_PATTERN = re.compile(r"-g([0-9a-f]+)$")
+GIT_BRANCH_PATTERN = re.compile(r"On branch (.+)")
+GIT_REMOTE_ORIGIN_PATTERN = re.compile(r'\[remote "origin"\]')
+GIT_URL_PATTERN = re.compile(r"url\s*=\s*(.+)")
 
 
 def parse_git_describe(describe_path: str | Path) -> dict[str, str | None]:
@@ -17,31 +25,31 @@ def parse_git_describe(describe_path: str | Path) -> dict[str, str | None]:
     dict[str, str | None]
         Dictionary with 'git_tag' and 'git_commit_hash' keys.
     """
-    describe_path = Path(describe_path)
-    describe_lines = _open_text(describe_path).splitlines()
+    describe_lines = _open_text_lines(describe_path)
     result: dict[str, str | None] = {"git_tag": None, "git_commit_hash": None}
 
-    describe_pattern = re.compile(r"^(?P<tag>v[\w.\-]+)(?:-\d+)?-g(?P<hash>[0-9a-f]+)")
-
     for line in describe_lines:
         line = line.strip()
         if line:
             # Example: v2.0.0-beta.3-3091-g3219b44fc
-            match = describe_pattern.match(line)
+            match = GIT_DESCRIBE_PATTERN.match(line)
             if match:
                 result["git_tag"] = match.group("tag")
                 result["git_commit_hash"] = match.group("hash")
-                continue
+                break
 
             # Fallback for less structured describe outputs
-            tag_match = re.match(r"^([^-]+)", line)
+            tag_match = GIT_DESCRIBE_TAG_PATTERN.match(line)
             if tag_match:
                 result["git_tag"] = tag_match.group(1)
 
-            hash_match = re.search(r"-g([0-9a-f]+)$", line)
+            hash_match = GIT_DESCRIBE_HASH_PATTERN.search(line)
             if hash_match:
                 result["git_commit_hash"] = hash_match.group(1)
 
+            if tag_match and hash_match:
+                break
+
     return result
 
 
@@ -58,8 +66,7 @@ def parse_git_status(status_path: str | Path) -> dict[str, str | None]:
     dict[str, str | None]
         Dictionary containing the current branch name, or None if not found.
     """
-    status_path = Path(status_path)
-    status_lines = _open_text(status_path).splitlines()
+    status_lines = _open_text_lines(status_path)
 
     return {"git_branch": _extract_branch(status_lines)}
 
@@ -77,8 +84,7 @@ def parse_git_config(config_path: str | Path) -> dict[str, str | None]:
     dict[str, str | None]
         Dictionary containing the repository URL, or None if not found.
     """
-    config_path = Path(config_path)
-    config_lines = _open_text(config_path).splitlines()
+    config_lines = _open_text_lines(config_path)
 
     url = None
     for line in config_lines:
@@ -89,34 +95,41 @@ def parse_git_config(config_path: str | Path) -> dict[str, str | None]:
     return {"git_repository_url": url}
 
 
-def _extract_branch(lines: list[str]) -> str | None:
+def _extract_branch(lines: Iterable[str]) -> str | None:
     """Extract the current branch from GIT_STATUS lines."""
     for line in lines:
-        m = re.match(r"On branch (.+)", line.strip())
+        stripped = line.strip()
+        if not stripped:
+            continue
 
+        m = GIT_BRANCH_PATTERN.match(stripped)
         if m:
-            return m.group(1).strip()
+            return m.group(1)
 
     return None
 
 
-def _extract_remote_url(lines: list[str]) -> str | None:
+def _extract_remote_url(lines: Iterable[str]) -> str | None:
     """Extract the remote URL for 'origin' from GIT_CONFIG lines."""
     in_origin = False
 
     for line in lines:
-        if re.match(r'\[remote "origin"\]', line.strip()):
+        stripped = line.strip()
+        if not stripped:
+            continue
+
+        if GIT_REMOTE_ORIGIN_PATTERN.match(stripped):
             in_origin = True
 
             continue
 
         if in_origin:
-            m = re.match(r"url\s*=\s*(.+)", line.strip())
+            m = GIT_URL_PATTERN.match(stripped)
             if m:
-                return m.group(1).strip()
+                return m.group(1)
 
             # End of section if another [ starts
-            if line.strip().startswith("["):
+            if stripped.startswith("["):
                 break
 
     return None
@@ -23,8 +23,12 @@ reliable mapping from raw archive contents to structured simulation metadata.
 
 import os
 import re
+import shutil
+import sys
 import tarfile
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 from typing import Callable, Iterable, TypedDict
 
@@ -47,6 +51,22 @@ from app.features.ingestion.parsers.types import ParsedSimulation
 from app.features.simulation.enums import SimulationStatus
 
 SimulationFiles = dict[str, str | None]
+ExecutionDirOutcome = tuple[ParsedSimulation | None, list[dict[str, str]], int]
+
+# Archives with at least this many execution directories are parsed on a
+# thread pool. Parsing is dominated by file reads and gzip decompression, both
+# of which release the GIL.
+PARALLEL_PARSE_MIN_EXECUTIONS = 8
+MAX_PARSE_WORKERS = 8
+
+# Read buffer for archive files during extraction. The default 8 KiB buffer
+# turns large archives into many small reads feeding zlib/zipfile.
+ARCHIVE_READ_BUFFER_SIZE = 1024 * 1024
+
+DEFAULT_STATUS = SimulationStatus.UNKNOWN.value
+
+# Execution directory names: <jobid>.<starttime>-<endtime>
+EXECUTION_DIR_PATTERN = re.compile(r"\d+\.\d+-\d+$")
 
 logger = _setup_custom_logger(__name__)
 
@@ -54,7 +74,7 @@ logger = _setup_custom_logger(__name__)
 class FileSpec(TypedDict, total=False):
     """Specifications for each file type to be parsed."""
 
-    pattern: str
+    pattern: re.Pattern[str]
     display_pattern: str
     location: str
     parser: Callable
@@ -79,63 +99,63 @@ class IncompleteArchiveError(FileNotFoundError):
 
 FILE_SPECS: dict[str, FileSpec] = {
     "case_docs_env_case": {
-        "pattern": r"env_case\.xml\..*\.gz",
+        "pattern": re.compile(r"env_case\.xml\..*\.gz"),
         "display_pattern": "env_case.xml..*.gz",
         "location": "casedocs",
         "parser": parse_env_case,
         "required": True,
     },
     "case_docs_env_build": {
-        "pattern": r"env_build\.xml\..*\.gz",
+        "pattern": re.compile(r"env_build\.xml\..*\.gz"),
         "display_pattern": "env_build.xml..*.gz",
         "location": "casedocs",
         "parser": parse_env_build,
         "required": True,
     },
     "case_docs_env_run": {
-        "pattern": r"env_run\.xml\..*",
+        "pattern": re.compile(r"env_run\.xml\..*"),
         "display_pattern": "env_run.xml..*",
         "location": "casedocs",
         "parser": parse_env_run,
         "required": True,
     },
     "readme_case": {
-        "pattern": r"README\.case\..*\.gz",
+        "pattern": re.compile(r"README\.case\..*\.gz"),
         "display_pattern": "README.case..*.gz",
         "location": "casedocs",
         "parser": parse_readme_case,
         "required": True,
     },
     "case_status": {
-        "pattern": r"CaseStatus\..*\.gz",
+        "pattern": re.compile(r"CaseStatus\..*\.gz"),
         "display_pattern": "CaseStatus..*.gz",
         "location": "root",
         "parser": parse_case_status,
         "required": True,
     },
     "e3sm_timing": {
-        "pattern": r"e3sm_timing\..*",
+        "pattern": re.compile(r"e3sm_timing\..*"),
         "display_pattern": "e3sm_timing..*..*",
         "location": "root",
         "parser": parse_e3sm_timing,
         "required": True,
     },
     "git_describe": {
-        "pattern": r"GIT_DESCRIBE\..*\.gz",
+        "pattern": re.compile(r"GIT_DESCRIBE\..*\.gz"),
         "display_pattern": "GIT_DESCRIBE..*.gz",
         "location": "root",
         "parser": parse_git_describe,
         "required": True,
     },
     "git_config": {
-        "pattern": r"GIT_CONFIG\..*\.gz",
+        "pattern": re.compile(r"GIT_CONFIG\..*\.gz"),
         "display_pattern": "GIT_CONFIG..*.gz",
         "location": "root",
         "parser": parse_git_config,
         "required": False,
     },
     "git_status": {
-        "pattern": r"GIT_STATUS\..*\.gz",
+        "pattern": re.compile(r"GIT_STATUS\..*\.gz"),
         "display_pattern": "GIT_STATUS..*.gz",
         "location": "root",
         "parser": parse_git_status,
@@ -144,6 +164,20 @@ FILE_SPECS: dict[str, FileSpec] = {
 }
 
 
+# One alternation per file location, with a named group per FILE_SPECS key, so
+# each directory entry is matched once and classified via ``Match.lastgroup``.
+FILE_LOCATION_PATTERNS: dict[str, re.Pattern[str]] = {
+    location: re.compile(
+        "|".join(
+            f"(?P<{key}>{spec['pattern'].pattern})"
+            for key, spec in FILE_SPECS.items()
+            if spec["location"] == location
+        )
+    )
+    for location in ("root", "casedocs")
+}
+
+
 def main_parser(
     archive_path: str | Path,
     output_dir: str | Path,
@@ -203,6 +237,7 @@ def main_parser(
     skipped_count = 0
 
     validation_errors: list[dict[str, str]] = []
+    ordered_exec_dirs: list[str] = []
 
     for case_dir, exec_dirs in case_to_executions_dirs.items():
         sorted_exec_dirs = sorted(exec_dirs)
@@ -210,16 +245,20 @@ def main_parser(
             f"Processing case directory: {case_dir} with {len(sorted_exec_dirs)} "
             "execution subdirectories."
         )
+        ordered_exec_dirs.extend(sorted_exec_dirs)
 
-        for exec_dir in sorted_exec_dirs:
-            parsed_simulation, exec_validation_errors, exec_skipped_count = (
-                _process_execution_dir(exec_dir, strict_validation=strict_validation)
-            )
-            skipped_count += exec_skipped_count
-            validation_errors.extend(exec_validation_errors)
+    for (
+        parsed_simulation,
+        exec_validation_errors,
+        exec_skipped_count,
+    ) in _process_execution_dirs(
+        ordered_exec_dirs, strict_validation=strict_validation
+    ):
+        skipped_count += exec_skipped_count
+        validation_errors.extend(exec_validation_errors)
 
-            if parsed_simulation is not None:
-                results.append(parsed_simulation)
+        if parsed_simulation is not None:
+            results.append(parsed_simulation)
 
     if validation_errors:
         raise ArchiveValidationError(validation_errors)
@@ -234,9 +273,39 @@ def main_parser(
     return results, skipped_count
 
 
+def _process_execution_dirs(
+    exec_dirs: list[str], *, strict_validation: bool
+) -> list[ExecutionDirOutcome]:
+    """Parse execution directories, returning outcomes in input order.
+
+    Parameters
+    ----------
+    exec_dirs : list[str]
+        Execution directories in deterministic processing order.
+    strict_validation : bool
+        Whether missing or invalid metadata is reported instead of skipped.
+
+    Returns
+    -------
+    list[ExecutionDirOutcome]
+        One ``(parsed_simulation, validation_errors, skipped_count)`` outcome
+        per execution directory, in the same order as ``exec_dirs``.
+    """
+    process = partial(_process_execution_dir, strict_validation=strict_validation)
+
+    if len(exec_dirs) < PARALLEL_PARSE_MIN_EXECUTIONS:
+        return [process(exec_dir) for exec_dir in exec_dirs]
+
+    with ThreadPoolExecutor(
+        max_workers=min(MAX_PARSE_WORKERS, len(exec_dirs)),
+        thread_name_prefix="archive-parser",
+    ) as executor:
+        return list(executor.map(process, exec_dirs))
+
+
 def _process_execution_dir(
     exec_dir: str, *, strict_validation: bool
-) -> tuple[ParsedSimulation | None, list[dict[str, str]], int]:
+) -> ExecutionDirOutcome:
     try:
         metadata_files = _locate_metadata_files(exec_dir)
         return _parse_all_files(exec_dir, metadata_files), [], 0
@@ -281,17 +350,52 @@ def _is_supported_archive(path: str) -> bool:
 
 def _extract_zip(zip_path: str, extract_to: str) -> None:
     """Extracts a ZIP archive to the target directory."""
-    with zipfile.ZipFile(zip_path, "r") as zip_ref:
+    with (
+        open(zip_path, "rb", buffering=ARCHIVE_READ_BUFFER_SIZE) as archive_file,
+        zipfile.ZipFile(archive_file, "r") as zip_ref,
+    ):
         _safe_extract(
             extract_to,
             (info.filename for info in zip_ref.infolist()),
-            zip_ref.extractall,
+            lambda path: _extract_zip_members(zip_ref, path),
         )
 
 
+def _extract_zip_members(zip_ref: zipfile.ZipFile, path: str) -> None:
+    """Extract zip members, copying file data in ARCHIVE_READ_BUFFER_SIZE chunks.
+
+    ``ZipFile.extractall`` copies each member with ``shutil.copyfileobj``'s
+    default chunk size. Member names are sanitized the same way it does
+    (drive letters and empty, ``.`` and ``..`` components are dropped).
+    """
+    for info in zip_ref.infolist():
+        arcname = os.path.splitdrive(info.filename.replace("/", os.path.sep))[1]
+        parts = [
+            part
+            for part in arcname.split(os.path.sep)
+            if part not in ("", os.path.curdir, os.path.pardir)
+        ]
+        target_path = os.path.join(path, *parts)
+
+        if info.is_dir():
+            os.makedirs(target_path, exist_ok=True)
+            continue
+
+        os.makedirs(os.path.dirname(target_path), exist_ok=True)
+        with zip_ref.open(info) as src, open(target_path, "wb") as dst:
+            shutil.copyfileobj(src, dst, length=ARCHIVE_READ_BUFFER_SIZE)
+
+
 def _extract_tar_gz(tar_gz_path: str, extract_to: str) -> None:
     """Extracts a TAR.GZ archive to the target directory."""
-    with tarfile.open(tar_gz_path, "r:gz") as tar_ref:
+    with (
+        open(tar_gz_path, "rb", buffering=ARCHIVE_READ_BUFFER_SIZE) as archive_file,
+        tarfile.open(
+            fileobj=archive_file,
+            mode="r:gz",
+            copybufsize=ARCHIVE_READ_BUFFER_SIZE,
+        ) as tar_ref,
+    ):
         _safe_extract(
             extract_to,
             (member.name for member in tar_ref.getmembers()),
@@ -369,18 +473,40 @@ def _map_case_to_execution_dirs(root_dir: str) -> dict[str, list[str]]:
             ...
         }
     """
-    exp_dir_pattern = re.compile(r"\d+\.\d+-\d+$")
     grouped_matches: dict[str, list[str]] = {}
+    _collect_execution_dirs(root_dir, grouped_matches)
 
-    for dirpath, dirnames, _ in os.walk(root_dir):
-        for dirname in dirnames:
-            if exp_dir_pattern.match(dirname):
-                parent_dir = os.path.basename(dirpath)
-                full_path = os.path.join(dirpath, dirname)
+    return grouped_matches
 
-                grouped_matches.setdefault(parent_dir, []).append(full_path)
 
-    return grouped_matches
+def _collect_execution_dirs(
+    dirpath: str, grouped_matches: dict[str, list[str]]
+) -> None:
+    """Walk ``dirpath`` top-down, recording execution directories by parent.
+
+    Uses ``os.scandir`` so directory entries are classified from the cached
+    ``d_type`` instead of a ``stat`` per name. Like ``os.walk``, symlinked
+    directories are matched but not descended into, and unreadable directories
+    are skipped. Execution directories hold run files (including the CaseDocs
+    subtree) rather than further executions, so they are not descended into.
+    """
+    try:
+        with os.scandir(dirpath) as entries:
+            subdirs = [entry for entry in entries if entry.is_dir()]
+    except OSError:
+        return
+
+    parent_dir = os.path.basename(dirpath)
+    descend: list[str] = []
+
+    for entry in subdirs:
+        if EXECUTION_DIR_PATTERN.match(entry.name):
+            grouped_matches.setdefault(parent_dir, []).append(entry.path)
+        elif not entry.is_symlink():
+            descend.append(entry.path)
+
+    for subdir in descend:
+        _collect_execution_dirs(subdir, grouped_matches)
 
 
 def _locate_metadata_files(exp_dir: str) -> SimulationFiles:
@@ -389,10 +515,10 @@ def _locate_metadata_files(exp_dir: str) -> SimulationFiles:
     invalid_archive_errors: list[dict[str, str]] = []
     missing_required_errors: list[dict[str, str]] = []
     missing_optional: list[str] = []
-    casedocs_dirs = _find_casedocs_dirs(exp_dir)
+    matches_by_key = _match_metadata_files(exp_dir)
 
     for key, spec in FILE_SPECS.items():
-        matches = _find_spec_matches(exp_dir, casedocs_dirs, spec)
+        matches = matches_by_key.get(key, [])
 
         if len(matches) > 1:
             invalid_archive_errors.append(
@@ -445,35 +571,34 @@ def _locate_metadata_files(exp_dir: str) -> SimulationFiles:
     return files
 
 
-def _find_casedocs_dirs(exp_dir: str) -> list[str]:
-    casedocs_dirs: list[str] = []
-
-    for subdir in os.listdir(exp_dir):
-        subdir_path = os.path.join(exp_dir, subdir)
+def _match_metadata_files(exp_dir: str) -> dict[str, list[str]]:
+    """Group metadata file paths by the FILE_SPECS key their name matches.
 
-        if os.path.isdir(subdir_path) and subdir.lower().startswith("casedocs"):
-            casedocs_dirs.append(subdir_path)
-
-    return casedocs_dirs
+    The execution directory is scanned once; CaseDocs subdirectories are
+    scanned as they are encountered rather than in a separate listing.
+    """
+    matches: dict[str, list[str]] = {}
+    root_pattern = FILE_LOCATION_PATTERNS["root"]
+    casedocs_pattern = FILE_LOCATION_PATTERNS["casedocs"]
 
+    with os.scandir(exp_dir) as entries:
+        for entry in entries:
+            _record_match(root_pattern, entry, matches)
 
-def _find_spec_matches(
-    exp_dir: str, casedocs_dirs: list[str], spec: FileSpec
-) -> list[str]:
-    if spec["location"] == "root":
-        directories = [exp_dir]
-    else:
-        directories = casedocs_dirs
+            if entry.name.lower().startswith("casedocs") and entry.is_dir():
+                with os.scandir(entry.path) as casedocs_entries:
+                    for casedocs_entry in casedocs_entries:
+                        _record_match(casedocs_pattern, casedocs_entry, matches)
 
-    matches: list[str] = []
-    pattern = str(spec["pattern"])
+    return matches
 
-    for directory in directories:
-        for fname in os.listdir(directory):
-            if re.match(pattern, fname):
-                matches.append(os.path.join(directory, fname))
 
-    return matches
+def _record_match(
+    pattern: re.Pattern[str], entry: os.DirEntry[str], matches: dict[str, list[str]]
+) -> None:
+    m = pattern.match(entry.name)
+    if m and m.lastgroup:
+        matches.setdefault(m.lastgroup, []).append(entry.path)
 
 
 def _location_label(location: str) -> str:
@@ -561,30 +686,32 @@ def _parse_all_files(exec_dir: str, files: dict[str, str | None]) -> ParsedSimul
 
     execution_id = _resolve_execution_id(metadata.get("execution_id"), exec_dir)
 
+    # Case, machine, and build settings repeat across most executions in an
+    # archive, so intern them to share one string object per distinct value.
     return ParsedSimulation(
         execution_dir=exec_dir,
         execution_id=execution_id,
-        case_name=metadata.get("case_name"),
-        case_group=metadata.get("case_group"),
-        machine=metadata.get("machine"),
-        hpc_username=metadata.get("user"),
-        compset=metadata.get("compset"),
-        compset_alias=metadata.get("compset_alias"),
-        grid_name=metadata.get("grid_name"),
-        grid_resolution=metadata.get("grid_resolution"),
-        campaign=metadata.get("campaign"),
-        experiment_type=metadata.get("experiment_type"),
-        initialization_type=metadata.get("initialization_type"),
+        case_name=_intern_optional(metadata.get("case_name")),
+        case_group=_intern_optional(metadata.get("case_group")),
+        machine=_intern_optional(metadata.get("machine")),
+        hpc_username=_intern_optional(metadata.get("user")),
+        compset=_intern_optional(metadata.get("compset")),
+        compset_alias=_intern_optional(metadata.get("compset_alias")),
+        grid_name=_intern_optional(metadata.get("grid_name")),
+        grid_resolution=_intern_optional(metadata.get("grid_resolution")),
+        campaign=_intern_optional(metadata.get("campaign")),
+        experiment_type=_intern_optional(metadata.get("experiment_type")),
+        initialization_type=_intern_optional(metadata.get("initialization_type")),
         simulation_start_date=metadata.get("simulation_start_date"),
         simulation_end_date=metadata.get("simulation_end_date"),
         run_start_date=metadata.get("run_start_date"),
         run_end_date=metadata.get("run_end_date"),
-        compiler=metadata.get("compiler"),
-        git_repository_url=metadata.get("git_repository_url"),
-        git_branch=metadata.get("git_branch"),
-        git_tag=metadata.get("git_tag"),
+        compiler=_intern_optional(metadata.get("compiler")),
+        git_repository_url=_intern_optional(metadata.get("git_repository_url")),
+        git_branch=_intern_optional(metadata.get("git_branch")),
+        git_tag=_intern_optional(metadata.get("git_tag")),
         git_commit_hash=metadata.get("git_commit_hash"),
-        status=metadata.get("status") or SimulationStatus.UNKNOWN.value,
+        status=_intern_optional(metadata.get("status")) or DEFAULT_STATUS,
         output_path=metadata.get("output_path"),
         archive_path=metadata.get("archive_path"),
         case_root=metadata.get("case_root"),
@@ -593,6 +720,10 @@ def _parse_all_files(exec_dir: str, files: dict[str, str | None]) -> ParsedSimul
     )
 
 
+def _intern_optional(value: str | None) -> str | None:
+    return sys.intern(value) if value is not None else None
+
+
 def _resolve_execution_id(execution_id: str | None, exec_dir: str) -> str:
     """Return a stable execution_id or treat the run as incomplete."""
     if execution_id is None:
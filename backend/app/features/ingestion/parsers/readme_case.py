@@ -3,6 +3,8 @@ from pathlib import Path
 
 from app.features.ingestion.parsers.utils import _open_text
 
+CREATION_TIMESTAMP_PATTERN = re.compile(r"(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})")
+
 
 def parse_readme_case(path: str | Path) -> dict[str, str | None]:
     """
@@ -18,7 +20,6 @@ def parse_readme_case(path: str | Path) -> dict[str, str | None]:
     dict[str, str | None]
         Dictionary with keys: 'creation_date', 'res', 'compset'.
     """
-    path = Path(path)
     text = _open_text(path)
     lines = text.splitlines()
 
@@ -34,7 +35,7 @@ def _extract_timestamp(lines: list[str]) -> str | None:
     Extract the timestamp from the first line (format: YYYY-MM-DD HH:MM:SS: ...)
     """
     if lines:
-        m = re.match(r"(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})", lines[0])
+        m = CREATION_TIMESTAMP_PATTERN.match(lines[0])
 
         if m:
             return m.group(1)
@@ -1,14 +1,21 @@
 import gzip
+import io
+from collections.abc import Iterator
 from pathlib import Path
+from typing import TextIO
 
+# Read buffer for parser input files. Gzip's default 8 KiB buffer makes zlib
+# decompress large timing files in many small steps.
+TEXT_READ_BUFFER_SIZE = 256 * 1024
 
-def _open_text(path: Path) -> str:
+
+def _open_text(path: str | Path) -> str:
     """
     Open a file (plain or gzipped) and return its text content.
 
     Parameters
     ----------
-    path : Path
+    path : str or Path
         Path to the file.
 
     Returns
@@ -16,12 +23,67 @@ def _open_text(path: Path) -> str:
     str
         File contents as a string.
     """
+    # Whole-file reads skip the buffered text stack: read the raw bytes in one
+    # call and decode once. ``gzip.decompress`` inflates in C without the
+    # GzipFile read loop and, unlike a bare ``zlib.decompress``, keeps every
+    # member of a multi-member archive.
+    with open(path, "rb", buffering=0) as raw:
+        data = raw.read()
+
+    if str(path).endswith(".gz"):
+        data = gzip.decompress(data)
+
+    return _decode_text(data)
+
+
+def _decode_text(data: bytes) -> str:
+    """Decode UTF-8 bytes with the same newline handling as text-mode reads."""
+    text = data.decode("utf-8", errors="replace")
+
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+
+    return text
+
+
+def _open_text_lines(path: str | Path) -> Iterator[str]:
+    """
+    Lazily yield lines from a file (plain or gzipped).
+
+    Unlike ``_open_text``, the file is never held in memory as a whole, so
+    callers can stop reading as soon as they have what they need. Read errors
+    are raised on first iteration.
+
+    Parameters
+    ----------
+    path : str or Path
+        Path to the file.
+
+    Yields
+    ------
+    str
+        Lines from the file, including their trailing newline.
+    """
+    with _open_text_stream(path) as f:
+        yield from f
+
+
+def _open_text_stream(path: str | Path) -> TextIO:
+    """Open a file (plain or gzipped) as text with a large read buffer."""
     if str(path).endswith(".gz"):
-        with gzip.open(path, "rt", encoding="utf-8", errors="replace") as f:
-            return f.read()
-    else:
-        with open(path, "rt", encoding="utf-8", errors="replace") as f:
-            return f.read()
+        return io.TextIOWrapper(
+            io.BufferedReader(gzip.open(path, "rb"), buffer_size=TEXT_READ_BUFFER_SIZE),
+            encoding="utf-8",
+            errors="replace",
+        )
+
+    return open(
+        path,
+        "rt",
+        buffering=TEXT_READ_BUFFER_SIZE,
+        encoding="utf-8",
+        errors="replace",
+    )
 
 
 def _get_open_func(file_path: str):
@@ -1,5 +1,7 @@
 from typing import Literal
+from uuid import UUID
 
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.features.machine.models import Machine
@@ -47,3 +49,10 @@ def resolve_machine_by_name(db: Session, machine_name: str) -> Machine | None:
     canonical_name = canonicalize_machine_name(machine_name)
 
     return db.query(Machine).filter(Machine.name == canonical_name).first()
+
+
+def resolve_machine_id_by_name(db: Session, machine_name: str) -> UUID | None:
+    """Resolve a machine ID by canonical name without loading the Machine row."""
+    canonical_name = canonicalize_machine_name(machine_name)
+
+    return db.scalar(select(Machine.id).where(Machine.name == canonical_name))
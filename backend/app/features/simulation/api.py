@@ -4,7 +4,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy import and_, asc, desc, distinct, func, or_
 from sqlalchemy.dialects.postgresql import insert as pg_insert
-from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy.orm import Session, selectinload
 from sqlalchemy.sql.elements import ColumnElement
 
 from app.common.dependencies import get_database_session
@@ -13,7 +13,7 @@ from app.features.assistant.orchestrator import is_summary_llm_available
 from app.features.ingestion.enums import IngestionSourceType, IngestionStatus
 from app.features.ingestion.models import Ingestion
 from app.features.machine.models import Machine
-from app.features.machine.utils import resolve_machine_by_name
+from app.features.machine.utils import resolve_machine_id_by_name
 from app.features.simulation.enums import (
     ExternalLinkKind,
     SimulationStatus,
@@ -773,9 +773,9 @@ def _resolve_case_id_for_diagnostics_link(
     hpc_username: str,
 ) -> UUID:
     """Resolve a unique case ID from case, machine, and HPC username."""
-    machine = resolve_machine_by_name(db, machine_name)
+    machine_id = resolve_machine_id_by_name(db, machine_name)
 
-    if machine is None:
+    if machine_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="No case matched the provided case_name, machine, and hpc_username.",
@@ -784,7 +784,7 @@ def _resolve_case_id_for_diagnostics_link(
     match = (
         db.query(Case.id)
         .filter(Case.name == case_name)
-        .filter(Case.machine_id == machine.id)
+        .filter(Case.machine_id == machine_id)
         .filter(Case.hpc_username == hpc_username)
         .one_or_none()
     )
@@ -1040,12 +1040,7 @@ def _external_link_to_out(link: ExternalLink) -> dict:
 
 
 def _simulation_detail_query(db: Session):
-    return db.query(Simulation).options(
-        joinedload(Simulation.case).joinedload(Case.machine),
-        joinedload(Simulation.case).selectinload(Case.links),
-        selectinload(Simulation.artifacts),
-        selectinload(Simulation.links),
-    )
+    return db.query(Simulation).options(*Simulation.default_options())
 
 
 def _simulation_to_out(sim: Simulation) -> SimulationOut:
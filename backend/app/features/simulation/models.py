@@ -7,12 +7,12 @@ from typing import TYPE_CHECKING, Literal, Optional
 from uuid import UUID
 
 from sqlalchemy import (
+    BigInteger,
     CheckConstraint,
     Date,
     DateTime,
     ForeignKey,
     Index,
-    Integer,
     String,
     Text,
     UniqueConstraint,
@@ -21,10 +21,19 @@ from sqlalchemy import (
 from sqlalchemy import Enum as SAEnum
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import (
+    Mapped,
+    joinedload,
+    mapped_column,
+    raiseload,
+    relationship,
+    selectinload,
+)
+from sqlalchemy.orm.interfaces import LoaderOption
 
 from app.common.models.base import Base
 from app.common.models.mixins import IDMixin, TimestampMixin
+from app.features.machine.models import Machine
 from app.features.simulation.enums import (
     ArtifactKind,
     ExternalLinkKind,
@@ -34,7 +43,6 @@ from app.features.simulation.enums import (
 
 if TYPE_CHECKING:
     from app.features.ingestion.models import Ingestion
-    from app.features.machine.models import Machine
 
 
 class Case(Base, IDMixin, TimestampMixin):
@@ -197,6 +205,46 @@ class Simulation(Base, IDMixin, TimestampMixin):
         back_populates="simulation", cascade="all, delete-orphan"
     )
 
+    @classmethod
+    def core_options(cls) -> tuple[LoaderOption, ...]:
+        """Return loader options for the case, machine, artifacts, and links.
+
+        This is the subset read outside the API serializers (e.g. by the
+        assistant summary), without the audit-user and site joins.
+        """
+        return (
+            # Machine.site_record and the audit users are lazy="joined" on the
+            # models; skip those joins here and fail loudly if a caller of the
+            # core set reads them.
+            joinedload(cls.case)
+            .joinedload(Case.machine)
+            .raiseload(Machine.site_record),
+            joinedload(cls.case).selectinload(Case.links),
+            selectinload(cls.artifacts),
+            selectinload(cls.links),
+            raiseload(cls.created_by_user),
+            raiseload(cls.last_updated_by_user),
+        )
+
+    @classmethod
+    def default_options(cls) -> tuple[LoaderOption, ...]:
+        """Return loader options for fully serializing a simulation.
+
+        Every relationship a serializer needs is eager loaded, and any other
+        relationship raises on access instead of issuing a lazy query.
+        """
+        return (
+            joinedload(cls.case)
+            .joinedload(Case.machine)
+            .joinedload(Machine.site_record),
+            joinedload(cls.case).selectinload(Case.links),
+            joinedload(cls.created_by_user),
+            joinedload(cls.last_updated_by_user),
+            selectinload(cls.artifacts),
+            selectinload(cls.links),
+            raiseload("*"),
+        )
+
 
 class Artifact(Base, IDMixin, TimestampMixin):
     __tablename__ = "artifacts"
@@ -221,7 +269,7 @@ class Artifact(Base, IDMixin, TimestampMixin):
     uri: Mapped[str] = mapped_column(String(1000))
     label: Mapped[Optional[str]] = mapped_column(String(200))
     checksum: Mapped[Optional[str]] = mapped_column(String(128))
-    size_bytes: Mapped[Optional[int]] = mapped_column(Integer)
+    size_bytes: Mapped[Optional[int]] = mapped_column(BigInteger)
 
     simulation: Mapped[Simulation] = relationship(
         back_populates="artifacts",
@@ -3,7 +3,7 @@
 from datetime import datetime, timezone
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
@@ -101,8 +101,9 @@ def create_api_token(
     )
 
     db.add(api_token)
+    # Every response field is set in Python (the id default runs at flush) and
+    # the session does not expire on commit, so no refresh SELECT is needed.
     db.commit()
-    db.refresh(api_token)
 
     # Return created token with raw token (only time it's returned).
     resp = ApiTokenCreated(
@@ -127,9 +128,11 @@ def create_api_token(
 def list_api_tokens(
     db: Session = Depends(get_database_session),
     user: User = Depends(current_active_user),
+    limit: int | None = Query(None, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
 ):
     """
-    List all API tokens.
+    List API tokens, oldest first.
 
     Only administrators can list API tokens.
 
@@ -139,6 +142,10 @@ def list_api_tokens(
         Database session
     user : User
         Current authenticated user
+    limit : int | None
+        Maximum number of tokens to return; all remaining tokens if omitted
+    offset : int
+        Number of tokens to skip
 
     Returns
     -------
@@ -156,7 +163,13 @@ def list_api_tokens(
             detail="Only administrators can list API tokens",
         )
 
-    tokens = db.query(ApiToken).all()
+    stmt = (
+        select(ApiToken)
+        .order_by(ApiToken.created_at, ApiToken.id)
+        .offset(offset)
+        .limit(limit)
+    )
+    tokens = db.scalars(stmt).all()
 
     return tokens
 
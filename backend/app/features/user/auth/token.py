@@ -1,5 +1,6 @@
 """Token authentication utilities for API token management."""
 
+import base64
 import hashlib
 import secrets
 from datetime import datetime, timezone
@@ -11,6 +12,9 @@ from sqlalchemy.orm import Session
 from app.features.user.auth.utils import get_jwt_strategy
 from app.features.user.models import ApiToken, User, UserRole
 
+# Prefix on every raw API token, so other bearer credentials can be told apart.
+TOKEN_PREFIX = "sbk_"
+
 # Bearer transport for JWT login (returns token as JSON).
 BEARER_TRANSPORT = BearerTransport(tokenUrl="auth/jwt/login")
 
@@ -20,7 +24,7 @@ JWT_BEARER_BACKEND: AuthenticationBackend = AuthenticationBackend(
 )
 
 
-def generate_token() -> tuple[str, str]:
+def generate_token() -> tuple[str, bytes]:
     """
     Generate a secure API token and its hash.
 
@@ -32,16 +36,15 @@ def generate_token() -> tuple[str, str]:
 
     Returns
     -------
-    tuple[str, str]
+    tuple[str, bytes]
         A tuple containing (raw_token, token_hash)
     """
-    # Generate at least 32 bytes of entropy
-    raw_token_b64 = secrets.token_urlsafe(32)
-    raw_token = f"sbk_{raw_token_b64}"
-
-    token_hash = hashlib.sha256(raw_token.encode()).hexdigest()
+    # Generate at least 32 bytes of entropy. The token is assembled and hashed
+    # as ASCII bytes (same format as ``secrets.token_urlsafe``), then decoded once.
+    token_b64 = base64.urlsafe_b64encode(secrets.token_bytes(32)).rstrip(b"=")
+    raw_token = TOKEN_PREFIX.encode("ascii") + token_b64
 
-    return raw_token, token_hash
+    return raw_token.decode("ascii"), hashlib.sha256(raw_token).digest()
 
 
 def validate_token(
@@ -51,8 +54,9 @@ def validate_token(
     Validate an API token and return the associated user.
 
     This function:
-    1. Computes SHA256 hash of the provided token
-    2. Looks up the token in the database by hash (indexed)
+    1. Rejects values without the API token prefix, then computes the
+       SHA256 hash of the provided token
+    2. Looks up the token and its user by hash (indexed) in one query
     3. Checks if token is revoked
     4. Optionally checks if token is expired
     5. Returns the associated user if valid, None otherwise
@@ -82,14 +86,27 @@ def validate_token(
       known token — not useful for discovering valid tokens.
     - Never logs raw tokens.
     """
-    token_hash = hashlib.sha256(raw_token.encode()).hexdigest()
+    # Bearer values without our prefix (e.g. JWTs) can never match a stored
+    # hash; the prefix is public, so rejecting on it reveals nothing.
+    if not raw_token.startswith(TOKEN_PREFIX):
+        return None
 
-    # Look up token by hash (indexed column — consistent query time).
-    token = db.query(ApiToken).filter(ApiToken.token_hash == token_hash).first()
+    token_hash = hash_token(raw_token)
 
-    if not token:
+    # Look up token by hash (indexed column — consistent query time), joining
+    # its user so authentication costs a single round trip.
+    row = (
+        db.query(ApiToken, User)
+        .join(User, User.id == ApiToken.user_id)
+        .filter(ApiToken.token_hash == token_hash)
+        .first()
+    )
+
+    if not row:
         return None
 
+    token, user = row
+
     if token.revoked:
         return None
 
@@ -97,9 +114,7 @@ def validate_token(
         if datetime.now(timezone.utc) > token.expires_at:
             return None
 
-    user = db.query(User).filter(User.id == token.user_id).first()
-
-    if not user or not user.is_active:
+    if not user.is_active:
         return None
 
     if user.role != UserRole.SERVICE_ACCOUNT:
@@ -108,7 +123,7 @@ def validate_token(
     return user
 
 
-def hash_token(raw_token: str) -> str:
+def hash_token(raw_token: str) -> bytes:
     """
     Compute SHA256 hash of a token.
 
@@ -119,7 +134,7 @@ def hash_token(raw_token: str) -> str:
 
     Returns
     -------
-    str
-        Hexadecimal digest of the SHA256 hash
+    bytes
+        Raw 32-byte SHA256 digest, as stored in ``ApiToken.token_hash``
     """
-    return hashlib.sha256(raw_token.encode()).hexdigest()
+    return hashlib.sha256(raw_token.encode()).digest()
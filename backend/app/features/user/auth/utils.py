@@ -1,8 +1,13 @@
+from functools import lru_cache
+
 from fastapi_users.authentication import JWTStrategy
 
 from app.core.config import settings
 
 
+# The strategy only holds the signing secret and lifetime, both fixed for the
+# process, so one instance is shared by every request.
+@lru_cache(maxsize=1)
 def get_jwt_strategy() -> JWTStrategy:
     """Return JWT strategy for authentication backends.
 
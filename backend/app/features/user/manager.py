@@ -7,6 +7,7 @@ from fastapi_users import BaseUserManager, FastAPIUsers, UUIDIDMixin
 from fastapi_users.db import SQLAlchemyUserDatabase
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from app.common.dependencies import get_database_session
 from app.core.database_async import get_async_session
@@ -94,7 +95,7 @@ async def current_active_user(
     if oauth_user is not None:
         return oauth_user
 
-    user = _resolve_api_token_user(request, db, allow_missing=False)
+    user = await _resolve_api_token_user(request, db, allow_missing=False)
     assert user is not None
 
     return user
@@ -110,7 +111,7 @@ async def optional_current_user(
     if oauth_user is not None:
         return oauth_user
 
-    return _resolve_api_token_user(request, db, allow_missing=True)
+    return await _resolve_api_token_user(request, db, allow_missing=True)
 
 
 def can_edit_managed_content(user: User | None) -> bool:
@@ -125,7 +126,7 @@ def can_edit_managed_content(user: User | None) -> bool:
     return user.role == UserRole.USER and user.has_verified_e3sm_membership
 
 
-def _resolve_api_token_user(
+async def _resolve_api_token_user(
     request: Request,
     db: Session,
     *,
@@ -142,15 +143,19 @@ def _resolve_api_token_user(
             detail="Not authenticated",
         )
 
-    parts = auth_header.split()
-    if len(parts) != 2 or parts[0].lower() != "bearer":
+    # SP and HTAB are the only whitespace a header value can carry, so fold tabs
+    # into spaces and split once instead of building a list with str.split().
+    scheme, _, token = auth_header.replace("\t", " ").partition(" ")
+    token = token.strip()
+    if scheme.lower() != "bearer" or not token or any(c.isspace() for c in token):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid authentication credentials",
         )
 
-    token = parts[1]
-    user = validate_token(token, db)
+    # Header checks stay on the event loop; only the sync Session query is
+    # sent to the threadpool, so anonymous requests never pay the thread hop.
+    user = await run_in_threadpool(validate_token, token, db)
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
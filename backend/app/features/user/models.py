@@ -6,7 +6,7 @@ from fastapi_users.db import (
     SQLAlchemyBaseOAuthAccountTableUUID,
     SQLAlchemyBaseUserTableUUID,
 )
-from sqlalchemy import Boolean, DateTime, ForeignKey, String
+from sqlalchemy import Boolean, DateTime, ForeignKey, LargeBinary, String
 from sqlalchemy import Enum as SQLEnum
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -87,8 +87,9 @@ class ApiToken(Base):
 
     name: Mapped[str] = mapped_column(String(200), nullable=False)
 
-    token_hash: Mapped[str] = mapped_column(
-        String(64), nullable=False, unique=True, index=True
+    # Raw 32-byte SHA256 digest; half the index width of a hex string.
+    token_hash: Mapped[bytes] = mapped_column(
+        LargeBinary(32), nullable=False, unique=True, index=True
     )
 
     user_id: Mapped[uuid.UUID] = mapped_column(
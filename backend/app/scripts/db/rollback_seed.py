@@ -2,108 +2,70 @@
 
 from uuid import UUID
 
-from sqlalchemy import delete, select
+from sqlalchemy import delete, exists, select
 from sqlalchemy.orm import Session
 
 import app.models  # noqa: F401 # required to register models with SQLAlchemy
 from app.core.config import settings
 from app.core.database import SessionLocal
 from app.features.ingestion.models import Ingestion
-from app.features.simulation.models import (
-    Artifact,
-    Case,
-    ExternalLink,
-    Simulation,
-)
+from app.features.simulation.models import Case, Simulation
 from app.features.user.models import OAuthAccount, User
 
 DEV_EMAIL = f"simboard-dev@{settings.domain}"
 DEV_OAUTH_PROVIDER = "github"
 SEED_SOURCE_PREFIX = "seed:%"
 
+# Bulk DELETEs here never need the session's identity map brought in line row by
+# row (which costs an extra SELECT or RETURNING); the session is expired once
+# after commit instead.
+BULK_DELETE_OPTIONS = {"synchronize_session": False}
+
 
 def rollback_seed(db: Session):
     """Rollback all seeded data."""
     print("🔄 Rolling back seeded data...")
     try:
         # Ingestions created by app/scripts/seed.py are marked as source_reference="seed:<name>"
-        seed_ingestion_ids = (
-            db.execute(
-                select(Ingestion.id).where(
-                    Ingestion.__table__.c.source_reference.like(SEED_SOURCE_PREFIX)
-                )
-            )
-            .scalars()
-            .all()
+        is_seed_ingestion = Ingestion.__table__.c.source_reference.like(
+            SEED_SOURCE_PREFIX
         )
-
-        if seed_ingestion_ids:
-            simulation_ids = (
+        seed_ingestion_ids = select(Ingestion.__table__.c.id).where(is_seed_ingestion)
+
+        # Artifacts and external links reference simulations with
+        # ON DELETE CASCADE, so deleting the simulations removes them in the
+        # same statement. RETURNING collects the affected cases without a
+        # separate SELECT; the seed ingestion ids stay server-side as a subquery.
+        case_ids: list[UUID] = list(
+            set(
                 db.execute(
-                    select(Simulation.id).where(
-                        Simulation.__table__.c.ingestion_id.in_(seed_ingestion_ids)
-                    )
+                    delete(Simulation)
+                    .where(Simulation.__table__.c.ingestion_id.in_(seed_ingestion_ids))
+                    .returning(Simulation.__table__.c.case_id),
+                    execution_options=BULK_DELETE_OPTIONS,
                 )
                 .scalars()
                 .all()
             )
+        )
 
-            # Collect case_ids before deleting simulations
-            case_ids: list[UUID] = []
-            if simulation_ids:
-                case_ids = list(
-                    db.execute(
-                        select(Simulation.__table__.c.case_id)
-                        .where(Simulation.__table__.c.id.in_(simulation_ids))
-                        .distinct()
-                    )
-                    .scalars()
-                    .all()
-                )
-
-                db.execute(
-                    delete(ExternalLink).where(
-                        ExternalLink.__table__.c.simulation_id.in_(simulation_ids)
-                    )
-                )
-                db.execute(
-                    delete(Artifact).where(
-                        Artifact.__table__.c.simulation_id.in_(simulation_ids)
-                    )
-                )
-
-                db.execute(
-                    delete(Simulation).where(
-                        Simulation.__table__.c.id.in_(simulation_ids)
-                    )
-                )
+        db.execute(
+            delete(Ingestion).where(is_seed_ingestion),
+            execution_options=BULK_DELETE_OPTIONS,
+        )
 
+        # Delete cases that no longer have any simulations
+        if case_ids:
             db.execute(
-                delete(Ingestion).where(
-                    Ingestion.__table__.c.id.in_(seed_ingestion_ids)
-                )
+                delete(Case).where(
+                    Case.__table__.c.id.in_(case_ids),
+                    ~exists().where(
+                        Simulation.__table__.c.case_id == Case.__table__.c.id
+                    ),
+                ),
+                execution_options=BULK_DELETE_OPTIONS,
             )
 
-            # Delete cases that no longer have any simulations
-            if case_ids:
-                # Only delete cases that have no remaining simulations
-                cases_with_sims = list(
-                    db.execute(
-                        select(Simulation.__table__.c.case_id)
-                        .where(Simulation.__table__.c.case_id.in_(case_ids))
-                        .distinct()
-                    )
-                    .scalars()
-                    .all()
-                )
-                orphan_case_ids = set(case_ids) - set(cases_with_sims)
-                if orphan_case_ids:
-                    db.execute(
-                        delete(Case).where(
-                            Case.__table__.c.id.in_(list(orphan_case_ids))
-                        )
-                    )
-
         # Remove only the dummy OAuth account/user created by seed.py
         dev_user_id = db.execute(
             select(User.id).where(User.__table__.c.email == DEV_EMAIL)
@@ -114,11 +76,17 @@ def rollback_seed(db: Session):
                 delete(OAuthAccount).where(
                     OAuthAccount.__table__.c.user_id == dev_user_id,
                     OAuthAccount.__table__.c.oauth_name == DEV_OAUTH_PROVIDER,
-                )
+                ),
+                execution_options=BULK_DELETE_OPTIONS,
+            )
+            db.execute(
+                delete(User).where(User.__table__.c.id == dev_user_id),
+                execution_options=BULK_DELETE_OPTIONS,
             )
-            db.execute(delete(User).where(User.__table__.c.id == dev_user_id))
 
         db.commit()
+        # seed.py keeps using this session, which does not expire on commit.
+        db.expire_all()
 
         print("✅ Rollback complete.")
     except Exception as e:
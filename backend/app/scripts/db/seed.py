@@ -13,6 +13,7 @@ import os
 import sys
 from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
+from uuid import uuid4
 
 from pydantic import AnyUrl, HttpUrl
 from sqlalchemy import select
@@ -150,6 +151,7 @@ def seed_from_json(db: Session, json_path: str):
         db.refresh(first_user)
 
     first_user_id = first_user.id
+    machines_by_name = _load_machines_by_name(db)
 
     total_sims = 0
 
@@ -163,17 +165,21 @@ def seed_from_json(db: Session, json_path: str):
         if not simulations_data:
             raise ValueError(f"No simulations for case '{case_name}'")
 
-        case_machine = _resolve_seed_case_machine(db, simulations_data, case_name)
+        case_machine = _resolve_seed_case_machine(
+            machines_by_name, simulations_data, case_name
+        )
 
-        # Create the Case record
+        # Create the Case record. IDs are assigned client-side throughout so
+        # nothing needs a per-row flush; the unit of work batches each table's
+        # INSERTs at commit.
         case = Case(
+            id=uuid4(),
             name=case_name,
             machine_id=case_machine.id,
             hpc_username=DEV_HPC_USERNAME,
             case_group=case_group,
         )
         db.add(case)
-        db.flush()
 
         for sim_entry in simulations_data:
             _ = _seed_simulation(db, sim_entry, case, case_name, first_user_id)
@@ -201,8 +207,13 @@ def _parse_date(value) -> date | None:
     return parsed.date() if parsed is not None else None
 
 
+def _load_machines_by_name(db: Session) -> dict[str, Machine]:
+    """Load every machine once so seeding never queries machines per entry."""
+    return {machine.name: machine for machine in db.scalars(select(Machine))}
+
+
 def _resolve_seed_case_machine(
-    db: Session, simulations_data: list[dict], case_name: str
+    machines_by_name: dict[str, Machine], simulations_data: list[dict], case_name: str
 ) -> Machine:
     first_simulation = simulations_data[0]
     machine_name = first_simulation.get("machine", {}).get("name")
@@ -211,7 +222,7 @@ def _resolve_seed_case_machine(
             f"Missing 'machine.name' in first simulation entry for case '{case_name}'"
         )
 
-    machine = db.query(Machine).filter(Machine.name == machine_name).one_or_none()
+    machine = machines_by_name.get(machine_name)
     if not machine:
         raise ValueError(
             f"No machine found in DB with name '{machine_name}' for case '{case_name}'"
@@ -262,12 +273,6 @@ def _seed_simulation(
             f"Missing 'machine.name' in simulation entry for case '{case_name}'"
         )
 
-    machine = db.query(Machine).filter(Machine.name == machine_name).one_or_none()
-    if not machine:
-        raise ValueError(
-            f"No machine found in DB with name '{machine_name}' for case '{case_name}'"
-        )
-
     seed_payload = {
         key: value
         for key, value in sim_entry.items()
@@ -294,6 +299,7 @@ def _seed_simulation(
     sim = Simulation(
         **{
             **sim_in.model_dump(exclude={"artifacts", "links"}),
+            "id": uuid4(),
             "git_repository_url": str(sim_in.git_repository_url)
             if isinstance(sim_in.git_repository_url, HttpUrl)
             else sim_in.git_repository_url,
@@ -307,9 +313,11 @@ def _seed_simulation(
         )
 
     ingestion = Ingestion(
+        id=uuid4(),
         source_type=IngestionSourceType.HPC_PATH,
         source_reference=f"seed:{case_name}/{execution_id}",
-        machine_id=machine.id,
+        # The case machine was resolved once for all of its simulations.
+        machine_id=case.machine_id,
         triggered_by=user_id,
         status=IngestionStatus.SUCCESS,
         created_count=1,
@@ -318,11 +326,9 @@ def _seed_simulation(
         archive_sha256=None,
     )
     db.add(ingestion)
-    db.flush()
 
     sim.ingestion_id = ingestion.id
     db.add(sim)
-    db.flush()
 
     for a in sim_in.artifacts or []:
         db.add(
@@ -13,16 +13,14 @@ Optional:
 
 import argparse
 import getpass
-import json
 import ssl
 import sys
-import urllib.error
-import urllib.parse
-import urllib.request
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from urllib.parse import urlparse
 
+import httpx
+
 from app.api.version import API_BASE
 from app.core.config import settings
 
@@ -48,42 +46,48 @@ def main() -> None:
 
     print("Authenticating admin...")
 
-    jwt_token = login_and_get_token(base_url, admin_email, admin_password)
+    # One client for the whole run so login, service-account creation and token
+    # creation share a keep-alive connection (one TCP/TLS handshake).
+    with _build_client(base_url) as client:
+        jwt_token = login_and_get_token(client, base_url, admin_email, admin_password)
 
-    print("Authenticated.")
-    print("Provisioning service account...")
+        print("Authenticated.")
+        print("Provisioning service account...")
 
-    provision(
-        base_url,
-        jwt_token,
-        args.service_name,
-        args.expires_in_days,
-    )
+        provision(
+            client,
+            base_url,
+            jwt_token,
+            args.service_name,
+            args.expires_in_days,
+        )
 
 
-def login_and_get_token(base_url: str, email: str, password: str) -> str:
+def login_and_get_token(
+    client: httpx.Client, base_url: str, email: str, password: str
+) -> str:
     login_url = f"{base_url.rstrip('/')}{API_BASE}/auth/jwt/login"
 
-    form_data = urllib.parse.urlencode(
-        {"username": email, "password": password}
-    ).encode()
-
-    headers = {"Content-Type": "application/x-www-form-urlencoded"}
-    req = urllib.request.Request(login_url, data=form_data, headers=headers)
-
-    context = _build_ssl_context(login_url)
-
     try:
-        with urllib.request.urlopen(req, context=context) as resp:
-            payload = json.loads(resp.read())
-            return payload["access_token"]
-    except urllib.error.HTTPError as e:
-        body = e.read().decode()
-        print(f"Authentication failed ({e.code}): {body}", file=sys.stderr)
+        resp = client.post(login_url, data={"username": email, "password": password})
+    except httpx.TransportError as e:
+        print(f"Connection failed: {e}", file=sys.stderr)
         sys.exit(1)
 
+    # Redirects are not followed, so any non-2xx response (3xx included) is an
+    # error rather than a body to decode.
+    if not resp.is_success:
+        print(
+            f"Authentication failed ({resp.status_code}): {resp.text}",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+
+    return resp.json()["access_token"]
+
 
 def provision(
+    client: httpx.Client,
     base_url: str,
     jwt_token: str,
     service_name: str,
@@ -92,6 +96,7 @@ def provision(
     api_base = f"{base_url.rstrip('/')}{API_BASE}"
 
     user_data = _api_request(
+        client,
         f"{api_base}/tokens/service-accounts",
         jwt_token,
         {"service_name": service_name},
@@ -115,6 +120,7 @@ def provision(
         token_payload["expires_at"] = expires_at.isoformat()
 
     token_data = _api_request(
+        client,
         f"{api_base}/tokens",
         jwt_token,
         token_payload,
@@ -127,28 +133,28 @@ def provision(
     print("WARNING: Store securely. This token will not be shown again.")
 
 
-def _api_request(url: str, token: str, data: dict) -> dict:
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json",
-    }
-
-    request_body = json.dumps(data).encode("utf-8")
-    req = urllib.request.Request(url, data=request_body, headers=headers)
-
-    context = _build_ssl_context(url)
+def _api_request(client: httpx.Client, url: str, token: str, data: dict) -> dict:
+    headers = {"Authorization": f"Bearer {token}"}
 
     try:
-        with urllib.request.urlopen(req, context=context) as resp:
-            return json.loads(resp.read())
-    except urllib.error.HTTPError as e:
-        error_body = e.read().decode("utf-8", errors="replace")
-        print(f"API error ({e.code}): {error_body}", file=sys.stderr)
-        sys.exit(1)
-    except urllib.error.URLError as e:
+        resp = client.post(url, json=data, headers=headers)
+    except httpx.TransportError as e:
         print(f"Connection failed: {e}", file=sys.stderr)
         sys.exit(1)
 
+    if not resp.is_success:
+        print(f"API error ({resp.status_code}): {resp.text}", file=sys.stderr)
+        sys.exit(1)
+
+    return resp.json()
+
+
+def _build_client(base_url: str) -> httpx.Client:
+    context = _build_ssl_context(base_url)
+
+    # No timeout, matching the previous urllib behaviour for slow logins.
+    return httpx.Client(verify=context if context is not None else True, timeout=None)
+
 
 def _build_ssl_context(url: str) -> ssl.SSLContext | None:
     parsed = urlparse(url)
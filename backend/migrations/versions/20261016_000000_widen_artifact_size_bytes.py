@@ -0,0 +1,38 @@
+"""Widen artifact sizes to 64-bit integers.
+
+Revision ID: 20261016_000000
+Revises: 20260722_000000
+Create Date: 2026-10-16 00:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "20261016_000000"
+down_revision: Union[str, Sequence[str], None] = "20260722_000000"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Store artifact sizes as BIGINT so files over 2 GiB fit."""
+    op.alter_column(
+        "artifacts",
+        "size_bytes",
+        existing_type=sa.Integer(),
+        type_=sa.BigInteger(),
+        existing_nullable=True,
+    )
+
+
+def downgrade() -> None:
+    """Restore artifact sizes as 32-bit INTEGER values."""
+    op.alter_column(
+        "artifacts",
+        "size_bytes",
+        existing_type=sa.BigInteger(),
+        type_=sa.Integer(),
+        existing_nullable=True,
+    )
@@ -0,0 +1,40 @@
+"""Store API token hashes as raw SHA256 digests.
+
+Revision ID: 20261016_120000
+Revises: 20261016_000000
+Create Date: 2026-10-16 12:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "20261016_120000"
+down_revision: Union[str, Sequence[str], None] = "20261016_000000"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Convert hex token hashes to 32-byte BYTEA digests."""
+    op.alter_column(
+        "api_tokens",
+        "token_hash",
+        existing_type=sa.String(length=64),
+        type_=sa.LargeBinary(length=32),
+        existing_nullable=False,
+        postgresql_using="decode(token_hash, 'hex')",
+    )
+
+
+def downgrade() -> None:
+    """Restore token hashes as 64-character hex strings."""
+    op.alter_column(
+        "api_tokens",
+        "token_hash",
+        existing_type=sa.LargeBinary(length=32),
+        type_=sa.String(length=64),
+        existing_nullable=False,
+        postgresql_using="encode(token_hash, 'hex')",
+    )
@@ -21,6 +21,7 @@ from app.common.dependencies import get_database_session
 from app.core.config import settings
 from app.core.database_async import get_async_session
 from app.core.logger import _setup_custom_logger
+from app.features.ingestion import ingest
 from app.features.user.models import OAuthAccount, User, UserRole
 from app.main import app
 
@@ -96,6 +97,12 @@ def db(_connection) -> Generator[Session, None, None]:
         outer_tx.rollback()
 
 
+@pytest.fixture(autouse=True)
+def clear_machine_id_cache():
+    """Clear ingestion's machine ID cache, since test machines roll back per test."""
+    ingest._MACHINE_ID_CACHE.clear()
+
+
 @pytest.fixture(scope="session", autouse=True)
 def setup_test_db():
     """Sets up a test database for the application.
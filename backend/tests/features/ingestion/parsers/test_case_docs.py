@@ -7,6 +7,7 @@ from app.features.ingestion.parsers.case_docs import (
     parse_env_case,
     parse_env_run,
 )
+from app.features.ingestion.parsers.utils import _open_text
 
 
 class TestParseEnvCase:
@@ -207,6 +208,29 @@ class TestParseEnvRun:
         assert result["archive_path"] == "/tmp/archive"
         assert result["postprocessing_script"] == "/tmp/post.sh --flag value"
 
+    def test_reads_file_once_and_skips_empty_duplicate_entries(self, tmp_path):
+        xml_run = """
+        <config>
+            <entry id="RUN_TYPE" value="startup" />
+            <entry id="RUN_STARTDATE" value="2020-01-01" />
+            <entry id="RUNDIR"></entry>
+            <entry id="RUNDIR" value="/tmp/run" />
+            <entry id="RUNDIR" value="/tmp/ignored" />
+        </config>
+        """
+        tmp_run = tmp_path / "env_run_single_read.xml"
+        tmp_run.write_text(xml_run)
+
+        with patch(
+            "app.features.ingestion.parsers.case_docs._open_text",
+            wraps=_open_text,
+        ) as mock_open_text:
+            result = parse_env_run(tmp_run)
+
+        mock_open_text.assert_called_once_with(tmp_run)
+        assert result["initialization_type"] == "startup"
+        assert result["output_path"] == "/tmp/run"
+
     def test_missing_path_entries_return_none(self, tmp_path):
         xml_run = """
         <config>
@@ -303,6 +327,38 @@ class TestParseEnvRun:
 
         assert result["simulation_end_date"] == "2023-01-01"
 
+    def test_stop_option_nmonths_clamps_to_month_end(self, tmp_path):
+        xml_run = """
+        <config>
+            <entry id="RUN_TYPE" value="startup" />
+            <entry id="RUN_STARTDATE" value="2019-01-31" />
+            <entry id="STOP_OPTION" value="nmonths" />
+            <entry id="STOP_N" value="13" />
+        </config>
+        """
+        tmp_run = tmp_path / "env_run.xml"
+        tmp_run.write_text(xml_run)
+
+        result = parse_env_run(tmp_run)
+
+        assert result["simulation_end_date"] == "2020-02-29"
+
+    def test_stop_option_nyears_from_leap_day(self, tmp_path):
+        xml_run = """
+        <config>
+            <entry id="RUN_TYPE" value="startup" />
+            <entry id="RUN_STARTDATE" value="2020-02-29" />
+            <entry id="STOP_OPTION" value="nyears" />
+            <entry id="STOP_N" value="1" />
+        </config>
+        """
+        tmp_run = tmp_path / "env_run.xml"
+        tmp_run.write_text(xml_run)
+
+        result = parse_env_run(tmp_run)
+
+        assert result["simulation_end_date"] == "2021-02-28"
+
     def test_stop_option_date(self, tmp_path):
         xml_run = """
         <config>
@@ -8,7 +8,7 @@ class TestCaseStatusParser:
     def test_returns_unknown_status_on_read_error(self) -> None:
         with (
             patch(
-                "app.features.ingestion.parsers.case_status._open_text",
+                "app.features.ingestion.parsers.case_status._open_text_lines",
                 side_effect=OSError("boom"),
             ),
             patch(
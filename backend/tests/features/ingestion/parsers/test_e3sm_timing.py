@@ -123,7 +123,7 @@ class TestE3SMTimingParser:
 
     def test_read_error_returns_empty_result(self):
         with patch(
-            "app.features.ingestion.parsers.e3sm_timing._open_text",
+            "app.features.ingestion.parsers.e3sm_timing._open_text_lines",
             side_effect=OSError("boom"),
         ):
             data = parse_e3sm_timing(Path("/tmp/missing.txt"))
@@ -181,6 +181,21 @@ class TestE3SMTimingParser:
         assert data["run_end_date"] == "2025-12-18T20:54:58"
         assert data["run_start_date"] is None
 
+    def test_first_matching_line_wins_for_each_field(self, tmp_path):
+        content = (
+            "Curr Date   : Thu Dec 18 20:54:58 2025\n"
+            "LID         : 1081156.251218-200923\n"
+            "LID         : 9999999.000000-000000\n"
+            "Curr Date   : Fri Dec 19 01:00:00 2025\n"
+        )
+        file_path = tmp_path / "e3sm_timing_repeated.txt"
+        file_path.write_text(content)
+
+        data = parse_e3sm_timing(file_path)
+
+        assert data["execution_id"] == "1081156.251218-200923"
+        assert data["run_end_date"] == "2025-12-18T20:54:58"
+
     def test_parse_seconds_returns_none_on_float_value_error(self):
         with patch(
             "app.features.ingestion.parsers.e3sm_timing.float",
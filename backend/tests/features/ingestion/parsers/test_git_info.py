@@ -32,6 +32,17 @@ class TestGitInfoParser:
         assert result["git_tag"] == "release"
         assert result["git_commit_hash"] == "abcdef1"
 
+    def test_parse_git_describe_stops_at_first_complete_line(
+        self, tmp_path: Path
+    ) -> None:
+        content = "\nv3.0.0-12-gabc1234\nv9.9.9-1-gdeadbee\n"
+        file_path = tmp_path / "GIT_DESCRIBE"
+        file_path.write_text(content)
+
+        result = parse_git_describe(str(file_path))
+
+        assert result == {"git_tag": "v3.0.0-12", "git_commit_hash": "abc1234"}
+
     def test_parse_git_status_branch(self, tmp_path: Path) -> None:
         content = "On branch feature/59-automate-ingestion\n"
         file_path = tmp_path / "GIT_STATUS"
@@ -167,6 +167,59 @@ class TestMainParser:
         assert parser.FILE_SPECS["case_docs_env_run"]["required"] is True
         assert parser.FILE_SPECS["e3sm_timing"]["required"] is True
 
+    def test_match_metadata_files_classifies_by_location(self, tmp_path: Path) -> None:
+        exec_dir = tmp_path / "1.0-0"
+        casedocs = exec_dir / "CaseDocs"
+        casedocs.mkdir(parents=True)
+        for name in ("e3sm_timing.1.0-0", "GIT_DESCRIBE.1.gz", "env_case.xml.1.gz"):
+            (exec_dir / name).write_text("")
+        for name in ("env_case.xml.1.gz", "env_run.xml.1", "e3sm_timing.1.0-0"):
+            (casedocs / name).write_text("")
+
+        result = parser._match_metadata_files(str(exec_dir))
+
+        assert result == {
+            "e3sm_timing": [str(exec_dir / "e3sm_timing.1.0-0")],
+            "git_describe": [str(exec_dir / "GIT_DESCRIBE.1.gz")],
+            "case_docs_env_case": [str(casedocs / "env_case.xml.1.gz")],
+            "case_docs_env_run": [str(casedocs / "env_run.xml.1")],
+        }
+
+    def test_map_case_to_execution_dirs_skips_symlinked_subtrees(
+        self, tmp_path: Path
+    ) -> None:
+        case_dir = tmp_path / "group" / "case1"
+        (case_dir / "1.0-0" / "CaseDocs").mkdir(parents=True)
+        (case_dir / "not-an-execution").mkdir()
+        (tmp_path / "link").symlink_to(tmp_path / "group")
+
+        result = parser._map_case_to_execution_dirs(str(tmp_path))
+
+        assert result == {"case1": [str(case_dir / "1.0-0")]}
+
+    def test_map_case_to_execution_dirs_does_not_descend_into_executions(
+        self, tmp_path: Path
+    ) -> None:
+        execution_dir = tmp_path / "case1" / "1.0-0"
+        (execution_dir / "run" / "2.0-0").mkdir(parents=True)
+
+        result = parser._map_case_to_execution_dirs(str(tmp_path))
+
+        assert result == {"case1": [str(execution_dir)]}
+
+    def test_extract_zip_writes_members_and_directories(self, tmp_path: Path) -> None:
+        archive_path = tmp_path / "members.zip"
+        with zipfile.ZipFile(archive_path, "w") as zip_file:
+            zip_file.writestr("case/empty/", "")
+            zip_file.writestr("./case/1.0-0/data.txt", "payload" * 1000)
+
+        parser._extract_zip(str(archive_path), str(tmp_path / "out"))
+
+        assert (tmp_path / "out" / "case" / "empty").is_dir()
+        assert (tmp_path / "out" / "case" / "1.0-0" / "data.txt").read_text() == (
+            "payload" * 1000
+        )
+
     def test_resolve_execution_id_rejects_blank_values(self) -> None:
         with pytest.raises(
             FileNotFoundError,
@@ -938,6 +991,50 @@ class TestMainParser:
         assert len(result) == 2
         assert skipped == 0
 
+    def test_parallel_parsing_preserves_execution_order(self, tmp_path: Path) -> None:
+        casename_dir = tmp_path / "archive_extract" / "case1"
+        casename_dir.mkdir(parents=True)
+        names = [
+            f"{index}.0-0" for index in range(parser.PARALLEL_PARSE_MIN_EXECUTIONS)
+        ]
+
+        for name in reversed(names):
+            execution_dir = casename_dir / name
+            execution_dir.mkdir()
+            self._create_execution_metadata_files(execution_dir, "001.001")
+
+        with (
+            self._mock_all_parsers(),
+            patch(
+                "app.features.ingestion.parsers.parser.ThreadPoolExecutor",
+                wraps=parser.ThreadPoolExecutor,
+            ) as mock_executor,
+        ):
+            result, skipped = parser.main_parser(casename_dir, tmp_path / "out")
+
+        mock_executor.assert_called_once()
+        assert skipped == 0
+        assert [sim.execution_id for sim in result] == sorted(names)
+
+    def test_small_archives_are_parsed_without_thread_pool(
+        self, tmp_path: Path
+    ) -> None:
+        casename_dir = tmp_path / "archive_extract" / "case1"
+        execution_dir = casename_dir / "1.0-0"
+        execution_dir.mkdir(parents=True)
+        self._create_execution_metadata_files(execution_dir, "001.001")
+
+        with (
+            self._mock_all_parsers(),
+            patch(
+                "app.features.ingestion.parsers.parser.ThreadPoolExecutor"
+            ) as mock_executor,
+        ):
+            result, _ = parser.main_parser(casename_dir, tmp_path / "out")
+
+        mock_executor.assert_not_called()
+        assert len(result) == 1
+
     def test_deterministic_sort_order(self, tmp_path: Path) -> None:
         archive_base = tmp_path / "archive_extract"
         casename_dir = archive_base / "case1"
@@ -1,6 +1,10 @@
 import gzip
 
-from app.features.ingestion.parsers.utils import _get_open_func, _open_text
+from app.features.ingestion.parsers.utils import (
+    _get_open_func,
+    _open_text,
+    _open_text_lines,
+)
 
 
 class TestParserUtils:
@@ -17,6 +21,31 @@ class TestParserUtils:
 
         assert _open_text(file_path) == "gz text"
 
+    def test_open_text_reads_every_member_of_gz_file(self, tmp_path):
+        file_path = tmp_path / "members.txt.gz"
+        file_path.write_bytes(gzip.compress(b"first\n") + gzip.compress(b"second\n"))
+
+        assert _open_text(file_path) == "first\nsecond\n"
+
+    def test_open_text_translates_newlines_and_replaces_bad_bytes(self, tmp_path):
+        file_path = tmp_path / "crlf.txt"
+        file_path.write_bytes(b"first\r\nsecond\rthird\xff\n")
+
+        assert _open_text(file_path) == "first\nsecond\nthird\ufffd\n"
+
+    def test_open_text_lines_yields_plain_file_lines(self, tmp_path):
+        file_path = tmp_path / "plain.txt"
+        file_path.write_text("first\nsecond\n")
+
+        assert list(_open_text_lines(file_path)) == ["first\n", "second\n"]
+
+    def test_open_text_lines_yields_gz_file_lines(self, tmp_path):
+        file_path = tmp_path / "plain.txt.gz"
+        with gzip.open(file_path, "wt", encoding="utf-8") as f:
+            f.write("first\nsecond")
+
+        assert list(_open_text_lines(file_path)) == ["first\n", "second"]
+
     def test_get_open_func_returns_gzip_open_for_gz(self):
         assert _get_open_func("file.txt.gz") is gzip.open
 
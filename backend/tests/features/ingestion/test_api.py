@@ -37,7 +37,7 @@ from app.features.ingestion.enums import (
     IngestionSourceType,
     IngestionStatus,
 )
-from app.features.ingestion.ingest import IngestArchiveResult
+from app.features.ingestion.ingest import IngestArchiveResult, IngestError
 from app.features.ingestion.models import (
     ArchiveScanCheckpoint,
     ExecutionDiscoveryResult,
@@ -1190,7 +1190,11 @@ class TestIngestFromPathEndpoint:
                 }
             ),
         ]
-        mock_errors = [{"file": "sim2.json", "error": "Invalid format"}]
+        mock_errors = [
+            IngestError(
+                execution_dir="sim2", error_type="ValueError", error="Invalid format"
+            )
+        ]
 
         with patch(
             "app.features.ingestion.api.ingest_archive",
@@ -1209,7 +1213,7 @@ class TestIngestFromPathEndpoint:
 
         assert data["created_count"] == 2
         assert data["duplicate_count"] == 0
-        assert data["errors"] == mock_errors
+        assert data["errors"] == [error.to_dict() for error in mock_errors]
 
         assert len(data["simulations"]) == 2
         assert {simulation["execution_id"] for simulation in data["simulations"]} == {
@@ -1296,7 +1300,11 @@ class TestIngestFromPathEndpoint:
                 simulations=[],
                 created_count=0,
                 duplicate_count=2,
-                errors=[{"execution_dir": "x", "error": "duplicate"}],
+                errors=[
+                    IngestError(
+                        execution_dir="x", error_type="ValueError", error="duplicate"
+                    )
+                ],
             ),
         ):
             client.post(f"{API_BASE}/ingestions/from-path", json=payload)
@@ -1637,7 +1645,11 @@ class TestIngestFromUploadEndpoint:
                 }
             )
         ]
-        mock_errors = [{"file": "sim2.json", "error": "Invalid format"}]
+        mock_errors = [
+            IngestError(
+                execution_dir="sim2", error_type="ValueError", error="Invalid format"
+            )
+        ]
 
         with patch(
             "app.features.ingestion.api.ingest_archive",
@@ -1657,7 +1669,7 @@ class TestIngestFromUploadEndpoint:
         assert res.status_code == 400
         assert res.json()["detail"] == {
             "message": "Archive validation failed.",
-            "errors": mock_errors,
+            "errors": [error.to_dict() for error in mock_errors],
         }
 
         ingestion = (
@@ -1676,8 +1688,14 @@ class TestIngestFromUploadEndpoint:
         file = BytesIO(file_content)
 
         mock_errors = [
-            {"file": "sim1.json", "error": "Invalid format"},
-            {"file": "sim2.json", "error": "Missing required field"},
+            IngestError(
+                execution_dir="sim1", error_type="ValueError", error="Invalid format"
+            ),
+            IngestError(
+                execution_dir="sim2",
+                error_type="ValueError",
+                error="Missing required field",
+            ),
         ]
 
         with patch(
@@ -1695,7 +1713,7 @@ class TestIngestFromUploadEndpoint:
         assert res.status_code == 400
         assert res.json()["detail"] == {
             "message": "Archive validation failed.",
-            "errors": mock_errors,
+            "errors": [error.to_dict() for error in mock_errors],
         }
 
         ingestion = (
@@ -1905,8 +1923,12 @@ class TestIngestFromUploadEndpoint:
         payload = {"archive_path": str(archive_path), "machine_name": machine.name}
 
         mock_errors = [
-            {"file": "sim1.json", "error": "Invalid format"},
-            {"file": "sim2.json", "error": "Missing field"},
+            IngestError(
+                execution_dir="sim1", error_type="ValueError", error="Invalid format"
+            ),
+            IngestError(
+                execution_dir="sim2", error_type="ValueError", error="Missing field"
+            ),
         ]
 
         with patch(
@@ -2132,6 +2154,61 @@ class TestIngestFromUploadEndpoint:
         assert simulation.artifacts[0].kind == "output"
         assert simulation.artifacts[0].uri == "https://example.com/output.tar.gz"
 
+    def test_persist_simulations_copies_artifact_labels_and_defaults(
+        self, client, db: Session, tmp_path
+    ):
+        """Test that COPY-loaded artifacts keep labels and get server defaults."""
+        machine = db.query(Machine).first()
+        assert machine is not None
+
+        archive_path = self._create_archive_file(tmp_path, "archive_copy.tar.gz")
+        payload = {"archive_path": str(archive_path), "machine_name": machine.name}
+
+        case = _create_case(db, "test_case_artifact_copy", machine=machine)
+
+        mock_simulations = [
+            SimulationCreate.model_validate(
+                {
+                    "caseId": str(case.id),
+                    "executionId": "exec-artifact-copy-1",
+                    "compset": "AQUAPLANET",
+                    "compsetAlias": "QPC4",
+                    "gridName": "f19_f19",
+                    "gridResolution": "1.9x2.5",
+                    "initializationType": "startup",
+                    "simulationType": "experimental",
+                    "status": "created",
+                    "simulationStartDate": "2023-01-01T00:00:00Z",
+                    "artifacts": [
+                        {"kind": "output", "uri": "/tmp/run", "label": " Run "},
+                        {"kind": "run_script", "uri": "/tmp/case/.case.run"},
+                    ],
+                }
+            )
+        ]
+
+        with patch(
+            "app.features.ingestion.api.ingest_archive",
+            return_value=IngestArchiveResult(
+                simulations=mock_simulations,
+                created_count=1,
+                duplicate_count=0,
+                errors=[],
+            ),
+        ):
+            res = client.post(f"{API_BASE}/ingestions/from-path", json=payload)
+
+        assert res.status_code == 201
+
+        simulation = db.query(Simulation).filter(Simulation.case_id == case.id).one()
+        artifacts = {artifact.uri: artifact for artifact in simulation.artifacts}
+
+        assert artifacts["/tmp/run"].kind == ArtifactKind.OUTPUT
+        assert artifacts["/tmp/run"].label == "Run"
+        assert artifacts["/tmp/case/.case.run"].label is None
+        assert all(artifact.id is not None for artifact in artifacts.values())
+        assert all(artifact.created_at is not None for artifact in artifacts.values())
+
     def test_persist_simulations_with_links(self, client, db: Session, tmp_path):
         """Test that simulations with external links are persisted correctly."""
         machine = db.query(Machine).first()
@@ -2188,6 +2265,84 @@ class TestIngestFromUploadEndpoint:
         assert simulation.links[0].kind == "diagnostic"
         assert simulation.links[0].url == "https://example.com/diagnostics"
 
+    def test_persist_simulations_bulk_inserts_mixed_payloads(
+        self, client, db: Session, tmp_path
+    ):
+        """Test that simulations with differing optional fields persist together."""
+        machine = db.query(Machine).first()
+        assert machine is not None
+
+        archive_path = self._create_archive_file(tmp_path, "archive_mixed.tar.gz")
+        payload = {"archive_path": str(archive_path), "machine_name": machine.name}
+
+        case = _create_case(db, "test_case_mixed", machine=machine)
+        base_payload = {
+            "caseId": str(case.id),
+            "compset": "AQUAPLANET",
+            "compsetAlias": "QPC4",
+            "gridName": "f19_f19",
+            "gridResolution": "1.9x2.5",
+            "initializationType": "startup",
+            "simulationType": "experimental",
+            "status": "created",
+            "simulationStartDate": "2023-01-01T00:00:00Z",
+        }
+
+        mock_simulations = [
+            SimulationCreate.model_validate(
+                {
+                    **base_payload,
+                    "executionId": "exec-mixed-1",
+                    "gitRepositoryUrl": "https://github.com/E3SM-Project/E3SM.git",
+                    "artifacts": [
+                        {
+                            "kind": "output",
+                            "uri": "https://example.com/output.tar.gz",
+                            "description": "Model output",
+                        },
+                        {"kind": "archive", "uri": "https://example.com/archive"},
+                    ],
+                }
+            ),
+            SimulationCreate.model_validate(
+                {
+                    **base_payload,
+                    "executionId": "exec-mixed-2",
+                    "links": [
+                        {"kind": "diagnostic", "url": "https://example.com/diag"}
+                    ],
+                }
+            ),
+        ]
+
+        with patch(
+            "app.features.ingestion.api.ingest_archive",
+            return_value=IngestArchiveResult(
+                simulations=mock_simulations,
+                created_count=2,
+                duplicate_count=0,
+                errors=[],
+            ),
+        ):
+            res = client.post(f"{API_BASE}/ingestions/from-path", json=payload)
+
+        assert res.status_code == 201
+        assert [sim["execution_id"] for sim in res.json()["simulations"]] == [
+            "exec-mixed-1",
+            "exec-mixed-2",
+        ]
+
+        simulations = {
+            sim.execution_id: sim
+            for sim in db.query(Simulation).filter(Simulation.case_id == case.id)
+        }
+
+        assert len(simulations["exec-mixed-1"].artifacts) == 2
+        assert simulations["exec-mixed-1"].links == []
+        assert simulations["exec-mixed-2"].artifacts == []
+        assert len(simulations["exec-mixed-2"].links) == 1
+        assert simulations["exec-mixed-2"].git_repository_url is None
+
     def test_upload_with_none_filename_in_validation(self, client):
         """Test that upload with file.filename = None is rejected by validation."""
 
@@ -2476,7 +2631,11 @@ class TestIngestFromHpcUploadEndpoint:
                 simulations=[],
                 created_count=0,
                 duplicate_count=1,
-                errors=[{"execution_dir": "x", "error": "duplicate"}],
+                errors=[
+                    IngestError(
+                        execution_dir="x", error_type="ValueError", error="duplicate"
+                    )
+                ],
             ),
         ):
             res = client.post(
@@ -2497,7 +2656,9 @@ class TestIngestFromHpcUploadEndpoint:
 
         assert res.status_code == 201
         assert res.json()["duplicate_count"] == 1
-        assert res.json()["errors"] == [{"execution_dir": "x", "error": "duplicate"}]
+        assert res.json()["errors"] == [
+            {"execution_dir": "x", "error_type": "ValueError", "error": "duplicate"}
+        ]
 
         ingestion = (
             db.query(Ingestion)
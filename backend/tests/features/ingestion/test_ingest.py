@@ -1,4 +1,4 @@
-from datetime import date, datetime
+from datetime import date, datetime, timezone
 from pathlib import Path
 from typing import Mapping
 from unittest.mock import MagicMock, patch
@@ -8,16 +8,22 @@ import pytest
 from dateutil import parser as real_dateutil_parser
 from sqlalchemy.orm import Session
 
+from app.features.ingestion import ingest as ingest_module
 from app.features.ingestion.ingest import (
     SimulationCreateDraft,
+    _build_path_artifacts,
     _build_simulation_create_draft,
     _extract_postprocessing_script_path,
     _get_known_case_hash,
     _get_or_create_case,
+    _load_existing_execution_keys,
+    _load_machine_ids,
     _normalize_git_url,
     _normalize_path_candidate,
     _normalize_simulation_status,
     _normalize_simulation_type,
+    _parse_date_field,
+    _parse_datetime_field,
     _track_case_hash_grouping,
     _validate_simulation_create,
     ingest_archive,
@@ -31,7 +37,7 @@ from app.features.ingestion.parsers.types import ParsedSimulation
 from app.features.machine.models import Machine
 from app.features.simulation.enums import ArtifactKind, SimulationStatus, SimulationType
 from app.features.simulation.models import Case, Simulation
-from app.features.simulation.schemas import SimulationCreate
+from app.features.simulation.schemas import ArtifactCreate, SimulationCreate
 from app.features.user.models import User
 from tests.features.site.utils import get_or_create_site
 
@@ -346,8 +352,8 @@ class TestIngestArchive:
 
         assert ingest_result.simulations == []
         assert len(ingest_result.errors) == 1
-        assert ingest_result.errors[0]["error_type"] == "LookupError"
-        assert "nonexistent-machine" in ingest_result.errors[0]["error"]
+        assert ingest_result.errors[0].error_type == "LookupError"
+        assert "nonexistent-machine" in ingest_result.errors[0].error
 
     def test_parses_various_date_formats_through_public_api(self, db: Session) -> None:
         """Test model-date parsing with various formats through public API.
@@ -462,7 +468,7 @@ class TestIngestArchive:
 
         assert ingest_result.simulations == []
         assert len(ingest_result.errors) == 1
-        assert ingest_result.errors[0]["error_type"] == "ValidationError"
+        assert ingest_result.errors[0].error_type == "ValidationError"
         assert db.query(Case).filter(Case.name == "invalid-model-date").first() is None
 
     def test_missing_required_fields_raise_validation_error(self, db: Session) -> None:
@@ -506,7 +512,7 @@ class TestIngestArchive:
 
         assert ingest_result.simulations == []
         assert len(ingest_result.errors) == 1
-        assert ingest_result.errors[0]["error_type"] == "ValueError"
+        assert ingest_result.errors[0].error_type == "ValueError"
 
     def test_machine_lookup_and_validation_through_public_api(
         self, db: Session
@@ -599,8 +605,8 @@ class TestIngestArchive:
 
         assert ingest_result.simulations == []
         assert len(ingest_result.errors) == 1
-        assert ingest_result.errors[0]["error_type"] == "LookupError"
-        assert "Machine 'nonexistent'" in ingest_result.errors[0]["error"]
+        assert ingest_result.errors[0].error_type == "LookupError"
+        assert "Machine 'nonexistent'" in ingest_result.errors[0].error
 
     @pytest.mark.parametrize(
         ("machine_alias", "canonical_name", "compute_type"),
@@ -935,7 +941,7 @@ class TestIngestArchiveContinued(TestIngestArchive):
 
         assert ingest_result.simulations == []
         assert len(ingest_result.errors) == 1
-        assert ingest_result.errors[0]["error_type"] == "ValidationError"
+        assert ingest_result.errors[0].error_type == "ValidationError"
         assert (
             db.query(Case).filter(Case.name == "orphan_case_validation").first() is None
         )
@@ -1301,8 +1307,8 @@ class TestIngestArchiveContinued(TestIngestArchive):
 
             assert ingest_result.simulations == []
             assert len(ingest_result.errors) == 1
-            assert ingest_result.errors[0]["error_type"] == "ValueError"
-            assert "Machine name is required" in ingest_result.errors[0]["error"]
+            assert ingest_result.errors[0].error_type == "ValueError"
+            assert "Machine name is required" in ingest_result.errors[0].error
 
     def test_missing_simulation_start_date(self, db: Session) -> None:
         """Test error when simulation_start_date cannot be parsed."""
@@ -1345,7 +1351,7 @@ class TestIngestArchiveContinued(TestIngestArchive):
 
             assert ingest_result.simulations == []
             assert len(ingest_result.errors) == 1
-            assert ingest_result.errors[0]["error_type"] == "ValidationError"
+            assert ingest_result.errors[0].error_type == "ValidationError"
 
 
 class TestNormalizeGitUrl:
@@ -2287,6 +2293,115 @@ class TestCaseHashIngestion:
 
 
 class TestIngestHelpers:
+    def test_load_existing_execution_keys_returns_primitive_keys(
+        self, db: Session
+    ) -> None:
+        machine = Machine(
+            name="key-machine",
+            site_record=get_or_create_site(db),
+            architecture="x86_64",
+            scheduler="SLURM",
+            gpu=False,
+        )
+        db.add(machine)
+        db.flush()
+        case = _create_case(db, name="keyed.case", machine=machine)
+        user = User(
+            id=uuid4(), email="keys@example.com", is_active=True, is_superuser=False
+        )
+        db.add(user)
+        db.flush()
+        ingestion = Ingestion(
+            source_type=IngestionSourceType.HPC_PATH,
+            source_reference="test_load_existing_execution_keys",
+            machine_id=machine.id,
+            triggered_by=user.id,
+            status=IngestionStatus.SUCCESS,
+            created_count=1,
+            duplicate_count=0,
+            error_count=0,
+        )
+        db.add(ingestion)
+        db.flush()
+        db.add(
+            Simulation(
+                case_id=case.id,
+                execution_id="1.1",
+                compset="FHIST",
+                compset_alias="FHIST_f09_fe",
+                grid_name="grid",
+                grid_resolution="0.9x1.25",
+                simulation_start_date=datetime(2020, 1, 1),
+                initialization_type="test",
+                simulation_type="test",
+                status=SimulationStatus.CREATED,
+                created_by=user.id,
+                last_updated_by=user.id,
+                ingestion_id=ingestion.id,
+            )
+        )
+        db.flush()
+
+        parsed_simulations = _parsed_simulations_from_mapping(
+            {
+                "/path/to/1.1": {"execution_id": "1.1", "case_name": "keyed.case"},
+                "/path/to/1.2": {"execution_id": "1.2", "case_name": "keyed.case"},
+            }
+        )
+
+        keys = _load_existing_execution_keys(parsed_simulations, db)
+
+        assert keys == {("keyed.case", machine.id.bytes, "test-user", "1.1")}
+
+    def test_load_machine_ids_resolves_aliases_in_one_query(self, db: Session) -> None:
+        machine = db.query(Machine).filter(Machine.name == "perlmutter").one()
+
+        machine_ids = _load_machine_ids(db, {"pm-cpu", "perlmutter", "unknown"})
+
+        assert machine_ids == {"pm-cpu": machine.id, "perlmutter": machine.id}
+
+    def test_load_machine_ids_serves_repeat_lookups_from_cache(
+        self, db: Session
+    ) -> None:
+        machine = db.query(Machine).filter(Machine.name == "perlmutter").one()
+        _load_machine_ids(db, {"perlmutter"})
+
+        cached_db = MagicMock()
+        machine_ids = _load_machine_ids(cached_db, {"pm-gpu"})
+
+        assert machine_ids == {"pm-gpu": machine.id}
+        cached_db.execute.assert_not_called()
+
+    def test_load_machine_ids_does_not_cache_misses(self, db: Session) -> None:
+        assert _load_machine_ids(db, {"late-machine"}) == {}
+
+        machine = TestIngestArchive._create_machine(db, "late-machine")
+
+        assert _load_machine_ids(db, {"late-machine"}) == {"late-machine": machine.id}
+
+    def test_load_machine_ids_refreshes_expired_entries(self, db: Session) -> None:
+        machine = db.query(Machine).filter(Machine.name == "perlmutter").one()
+        ingest_module._MACHINE_ID_CACHE["perlmutter"] = (0.0, uuid4())
+
+        assert _load_machine_ids(db, {"perlmutter"}) == {"perlmutter": machine.id}
+
+    def test_load_machine_ids_skips_query_without_names(self) -> None:
+        db = MagicMock()
+
+        assert _load_machine_ids(db, set()) == {}
+        db.execute.assert_not_called()
+
+    def test_load_existing_execution_keys_skips_query_without_case_names(
+        self,
+    ) -> None:
+        db = MagicMock()
+        parsed_simulations = _parsed_simulations_from_mapping(
+            {"/path/to/1.1": {"execution_id": "1.1", "case_name": None}}
+        )
+
+        assert _load_existing_execution_keys(parsed_simulations, db) == set()
+        db.execute.assert_not_called()
+
     def test_extract_postprocessing_script_path_returns_none_for_unparseable_value(
         self,
     ) -> None:
@@ -2313,6 +2428,63 @@ class TestIngestHelpers:
         assert result is None
         mock_split.assert_called_once_with("/tmp/post.sh")
 
+    def test_build_path_artifacts_matches_validated_artifacts(self) -> None:
+        parsed_simulation = ParsedSimulation(
+            execution_dir="/tmp/execution",
+            execution_id="1.1",
+            output_path="  /tmp/run  ",
+            archive_path="   ",
+            case_root="/tmp/case",
+            postprocessing_script="'' --flag",
+        )
+
+        result = _build_path_artifacts(parsed_simulation)
+
+        assert result == [
+            ArtifactCreate(kind=ArtifactKind.OUTPUT, uri="/tmp/run"),
+            ArtifactCreate(kind=ArtifactKind.RUN_SCRIPT, uri="/tmp/case/.case.run"),
+        ]
+
+    @pytest.mark.parametrize(
+        "value",
+        ["2020-01-02", "2020-01-02 03:04:05", "2020-01-02T03:04:05Z"],
+    )
+    def test_parse_datetime_field_uses_iso_fast_path(self, value: str) -> None:
+        with patch("app.features.ingestion.ingest.dateutil_parser.parse") as mock_parse:
+            result = _parse_datetime_field(value)
+
+        mock_parse.assert_not_called()
+        assert result is not None
+        assert result.tzinfo is not None
+        assert result.date() == date(2020, 1, 2)
+
+    def test_parse_datetime_field_falls_back_to_dateutil(self) -> None:
+        result = _parse_datetime_field("Jan 2, 2020 03:04:05")
+
+        assert result == datetime(2020, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+
+    def test_parse_date_field_uses_date_fast_path(self) -> None:
+        with patch(
+            "app.features.ingestion.ingest._parse_datetime_string"
+        ) as mock_parse:
+            result = _parse_date_field("2020-01-02")
+
+        mock_parse.assert_not_called()
+        assert result == date(2020, 1, 2)
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("2020-01-02T00:00:00Z", date(2020, 1, 2)),
+            ("Jan 2, 2020", date(2020, 1, 2)),
+            ("2020-01-02T03:04:05Z", None),
+        ],
+    )
+    def test_parse_date_field_handles_datetime_values(
+        self, value: str, expected: date | None
+    ) -> None:
+        assert _parse_date_field(value) == expected
+
     @pytest.mark.parametrize("value", [None, "", "   "])
     def test_normalize_path_candidate_returns_none_for_blank_values(
         self, value: str | None
@@ -2400,7 +2572,7 @@ class TestIngestHelpers:
         case_hash_cache: dict[tuple[str, UUID, str], str] = {}
         persisted_case_hash_cache: dict[UUID, str | None] = {case.id: "baseline-hash"}
 
-        with patch.object(db, "query", side_effect=AssertionError):
+        with patch.object(db, "scalar", side_effect=AssertionError):
             result = _get_known_case_hash(
                 case=case,
                 case_hash_cache=case_hash_cache,
@@ -10,6 +10,7 @@ from fastapi import status
 from app.api.version import API_BASE
 from app.common.models.base import Base
 from app.features.ingestion.enums import IngestionSourceType, IngestionStatus
+from app.features.ingestion.ingest import IngestError
 from app.features.ingestion.models import Ingestion
 from app.features.machine.models import Machine
 from app.features.simulation.enums import SimulationStatus, SimulationType
@@ -202,7 +203,11 @@ class TestIngestionWithAPIToken:
             mock_result = MagicMock()
             mock_result.created_count = 0
             mock_result.duplicate_count = 1
-            mock_result.errors = [{"execution_dir": "x", "error": "duplicate"}]
+            mock_result.errors = [
+                IngestError(
+                    execution_dir="x", error_type="ValueError", error="duplicate"
+                )
+            ]
             mock_result.simulations = []
             mock_ingest.return_value = mock_result
 
@@ -6,6 +6,7 @@ from app.features.machine.utils import (
     normalize_machine_name_for_storage,
     parse_machine_name,
     resolve_machine_by_name,
+    resolve_machine_id_by_name,
 )
 from tests.features.site.utils import get_or_create_site
 
@@ -72,3 +73,13 @@ class TestResolveMachineByName:
 
         assert resolved is not None
         assert resolved.id == machine.id
+
+
+class TestResolveMachineIdByName:
+    def test_resolves_alias_to_machine_id(self, db: Session) -> None:
+        machine = db.query(Machine).filter(Machine.name == "perlmutter").one()
+
+        assert resolve_machine_id_by_name(db, "pm-gpu") == machine.id
+
+    def test_returns_none_for_unknown_machine(self, db: Session) -> None:
+        assert resolve_machine_id_by_name(db, "missing-machine") is None
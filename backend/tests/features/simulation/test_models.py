@@ -4,8 +4,8 @@ from typing import cast
 from uuid import UUID, uuid4
 
 import pytest
-from sqlalchemy import Table, text
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy import Table, inspect, text
+from sqlalchemy.exc import IntegrityError, InvalidRequestError
 from sqlalchemy.orm import Session, sessionmaker
 
 from app.common.models.base import Base
@@ -13,11 +13,12 @@ from app.features.ingestion.enums import IngestionSourceType, IngestionStatus
 from app.features.ingestion.models import Ingestion
 from app.features.machine.models import Machine
 from app.features.simulation.enums import (
+    ArtifactKind,
     ExternalLinkKind,
     SimulationStatus,
     SimulationType,
 )
-from app.features.simulation.models import Case, ExternalLink, Simulation
+from app.features.simulation.models import Artifact, Case, ExternalLink, Simulation
 from app.features.site.models import Site
 from app.features.user.models import User
 from tests.conftest import engine
@@ -370,3 +371,112 @@ class TestExternalLinkOwnership:
             db.commit()
 
         db.rollback()
+
+
+class TestSimulationDefaultOptions:
+    def test_default_options_eager_load_serialized_relationships(
+        self, db: Session, normal_user_sync
+    ) -> None:
+        machine = _create_machine(db)
+        case = _create_case(db, "default-options-case", machine=machine)
+        ingestion = _create_ingestion(
+            db,
+            machine_id=machine.id,
+            user_id=normal_user_sync["id"],
+            source_reference="default-options",
+        )
+        simulation = _create_simulation(
+            db,
+            case_id=case.id,
+            ingestion_id=ingestion.id,
+            user_id=normal_user_sync["id"],
+            execution_id="default-options-exec",
+        )
+        db.commit()
+        db.expire_all()
+
+        loaded = (
+            db.query(Simulation)
+            .options(*Simulation.default_options())
+            .filter(Simulation.id == simulation.id)
+            .one()
+        )
+
+        assert loaded.case.machine.site == "NERSC"
+        assert loaded.case.links == []
+        assert loaded.created_by_user.id == normal_user_sync["id"]
+        assert loaded.artifacts == []
+        assert loaded.links == []
+
+        with pytest.raises(InvalidRequestError):
+            _ = loaded.ingestion
+
+    def test_core_options_skip_audit_users_and_site(
+        self, db: Session, normal_user_sync
+    ) -> None:
+        machine = _create_machine(db)
+        case = _create_case(db, "core-options-case", machine=machine)
+        ingestion = _create_ingestion(
+            db,
+            machine_id=machine.id,
+            user_id=normal_user_sync["id"],
+            source_reference="core-options",
+        )
+        simulation = _create_simulation(
+            db,
+            case_id=case.id,
+            ingestion_id=ingestion.id,
+            user_id=normal_user_sync["id"],
+            execution_id="core-options-exec",
+        )
+        db.commit()
+        db.expire_all()
+
+        loaded = (
+            db.query(Simulation)
+            .options(*Simulation.core_options())
+            .filter(Simulation.id == simulation.id)
+            .one()
+        )
+
+        unloaded = inspect(loaded).unloaded
+        assert {"case", "artifacts", "links"}.isdisjoint(unloaded)
+        assert {"created_by_user", "last_updated_by_user"} <= unloaded
+        assert "site_record" in inspect(loaded.case.machine).unloaded
+
+        with pytest.raises(InvalidRequestError):
+            _ = loaded.created_by_user
+
+
+class TestArtifactSizeBytes:
+    def test_size_bytes_stores_values_over_two_gibibytes(
+        self, db: Session, normal_user_sync
+    ) -> None:
+        machine = _create_machine(db)
+        case = _create_case(db, "large-artifact-case", machine=machine)
+        ingestion = _create_ingestion(
+            db,
+            machine_id=machine.id,
+            user_id=normal_user_sync["id"],
+            source_reference="large-artifact",
+        )
+        simulation = _create_simulation(
+            db,
+            case_id=case.id,
+            ingestion_id=ingestion.id,
+            user_id=normal_user_sync["id"],
+            execution_id="large-artifact-exec",
+        )
+        artifact = Artifact(
+            simulation_id=simulation.id,
+            kind=ArtifactKind.OUTPUT,
+            uri="https://example.com/large-output.nc",
+            size_bytes=5 * 1024**3,
+        )
+        db.add(artifact)
+        db.commit()
+        db.expire_all()
+
+        stored = db.query(Artifact).filter(Artifact.id == artifact.id).one()
+
+        assert stored.size_bytes == 5 * 1024**3
@@ -3,10 +3,12 @@ from datetime import date
 import pytest
 from sqlalchemy.orm import Session
 
+from app.features.ingestion.models import Ingestion
 from app.features.machine.models import Machine
 from app.features.simulation.models import Case
 from app.scripts.db.seed import (
     DEV_HPC_USERNAME,
+    _load_machines_by_name,
     _resolve_seed_case_machine,
     _seed_simulation,
 )
@@ -26,7 +28,7 @@ class TestResolveSeedCaseMachine:
         db.commit()
 
         resolved = _resolve_seed_case_machine(
-            db,
+            _load_machines_by_name(db),
             simulations_data=[
                 {"machine": {"name": "seed-machine"}},
                 {"machine": {"name": "seed-machine"}},
@@ -59,7 +61,7 @@ class TestResolveSeedCaseMachine:
 
         with pytest.raises(ValueError, match="mixes machines"):
             _resolve_seed_case_machine(
-                db,
+                _load_machines_by_name(db),
                 simulations_data=[
                     {"machine": {"name": "seed-machine-one"}},
                     {"machine": {"name": "seed-machine-two"}},
@@ -113,6 +115,10 @@ class TestSeedSimulation:
         )
 
         assert simulation.case_id == case.id
+        db.flush()
+        ingestion = db.get(Ingestion, simulation.ingestion_id)
+        assert ingestion is not None
+        assert ingestion.machine_id == machine.id
         assert simulation.ingestion_id is not None
         assert simulation.compute_type == "gpu"
         assert simulation.simulation_start_date == date(2023, 1, 1)
@@ -1,6 +1,6 @@
 """Integration tests for API token management endpoints."""
 
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 import pytest
 from fastapi import status
@@ -152,6 +152,37 @@ class TestTokenManagementAPI:
         finally:
             app.dependency_overrides.clear()
 
+    def test_list_tokens_paginates_oldest_first(
+        self, client, admin_user_sync, normal_user_sync, db
+    ):
+        """Test that limit and offset page through tokens by creation time."""
+        created_at = datetime.now(timezone.utc)
+        for index in range(3):
+            _, token_hash = generate_token()
+            db.add(
+                ApiToken(
+                    name=f"Paged Token {index}",
+                    token_hash=token_hash,
+                    user_id=normal_user_sync["id"],
+                    created_at=created_at + timedelta(seconds=index),
+                    revoked=False,
+                )
+            )
+        db.commit()
+
+        _override_as_user(db, admin_user_sync)
+
+        try:
+            response = client.get(f"{API_BASE}/tokens?limit=2&offset=1")
+
+            assert response.status_code == status.HTTP_200_OK
+            assert [token["name"] for token in response.json()] == [
+                "Paged Token 1",
+                "Paged Token 2",
+            ]
+        finally:
+            app.dependency_overrides.clear()
+
     def test_list_tokens_as_non_admin(self, client, normal_user_sync, db):
         """Test that a non-admin cannot list API tokens."""
         _override_as_user(db, normal_user_sync)
@@ -17,7 +17,8 @@ class TestGenerateToken:
         raw_token, token_hash = generate_token()
 
         assert isinstance(raw_token, str)
-        assert isinstance(token_hash, str)
+        assert isinstance(token_hash, bytes)
+        assert len(token_hash) == 32
 
     def test_generate_token_has_prefix(self):
         """Test that generated tokens have the 'sbk_' prefix."""
@@ -29,7 +30,7 @@ class TestGenerateToken:
         """Test that the hash matches the raw token."""
         raw_token, token_hash = generate_token()
 
-        expected_hash = hashlib.sha256(raw_token.encode()).hexdigest()
+        expected_hash = hashlib.sha256(raw_token.encode()).digest()
         assert token_hash == expected_hash
 
     def test_generate_token_unique(self):
@@ -47,7 +48,7 @@ class TestHashToken:
     def test_hash_token_sha256(self):
         """Test that hash_token produces correct SHA256 hash."""
         raw_token = "sbk_test_token_12345"
-        expected_hash = hashlib.sha256(raw_token.encode()).hexdigest()
+        expected_hash = hashlib.sha256(raw_token.encode()).digest()
 
         result = hash_token(raw_token)
 
@@ -64,19 +65,17 @@ class TestHashToken:
 
 
 def _mock_db(token=None, user=None):
-    """Create a mock DB session that returns the given token and user."""
+    """Create a mock DB session whose token/user join returns the given rows."""
     db = MagicMock()
 
-    def query_side_effect(model):
+    def query_side_effect(*models):
         mock_query = MagicMock()
         mock_filter = MagicMock()
-        if model is ApiToken:
-            mock_filter.first.return_value = token
-        elif model is User:
-            mock_filter.first.return_value = user
+        if models == (ApiToken, User) and token is not None:
+            mock_filter.first.return_value = (token, user or _make_service_user())
         else:
             mock_filter.first.return_value = None
-        mock_query.filter.return_value = mock_filter
+        mock_query.join.return_value.filter.return_value = mock_filter
         return mock_query
 
     db.query.side_effect = query_side_effect
@@ -116,6 +115,22 @@ class TestValidateToken:
         assert result.id == user.id
         assert result.email == user.email
 
+    def test_validate_token_loads_token_and_user_in_one_query(self):
+        """Test that the token and its user are fetched with a single query."""
+        user = _make_service_user()
+        raw_token, token_hash = generate_token()
+
+        token = MagicMock(spec=ApiToken)
+        token.token_hash = token_hash
+        token.user_id = user.id
+        token.revoked = False
+        token.expires_at = None
+
+        db = _mock_db(token=token, user=user)
+        validate_token(raw_token, db)
+
+        db.query.assert_called_once_with(ApiToken, User)
+
     def test_validate_token_invalid(self):
         """Test that an invalid token returns None."""
         db = _mock_db(token=None)
@@ -123,6 +138,14 @@ class TestValidateToken:
 
         assert result is None
 
+    def test_validate_token_without_prefix_skips_lookup(self):
+        """Test that non-API-token bearer values are rejected without a query."""
+        db = _mock_db(token=None)
+        result = validate_token("eyJhbGciOiJIUzI1NiJ9.payload.signature", db)
+
+        assert result is None
+        db.query.assert_not_called()
+
     def test_validate_token_revoked(self):
         """Test that a revoked token returns None."""
         raw_token, token_hash = generate_token()
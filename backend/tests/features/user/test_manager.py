@@ -1,3 +1,4 @@
+import threading
 import uuid
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -166,6 +167,56 @@ class TestCurrentActiveUser:
         assert exc_info.value.status_code == 401
         assert exc_info.value.detail == "Invalid authentication credentials"
 
+    @pytest.mark.asyncio
+    async def test_raises_401_for_bearer_without_token(self):
+        """Raises 401 when the Bearer scheme has no token."""
+        request = MagicMock()
+        request.headers.get.return_value = "Bearer "
+        db = MagicMock()
+
+        with pytest.raises(HTTPException) as exc_info:
+            await current_active_user(request=request, oauth_user=None, db=db)
+
+        assert exc_info.value.status_code == 401
+        assert exc_info.value.detail == "Invalid authentication credentials"
+
+    @pytest.mark.asyncio
+    async def test_raises_401_for_token_with_embedded_tab(self):
+        """Raises 401 when the token itself contains whitespace."""
+        request = MagicMock()
+        request.headers.get.return_value = "Bearer sbk_valid\textra"
+        db = MagicMock()
+
+        with patch("app.features.user.manager.validate_token") as mock_validate:
+            with pytest.raises(HTTPException) as exc_info:
+                await current_active_user(request=request, oauth_user=None, db=db)
+
+        assert exc_info.value.status_code == 401
+        assert exc_info.value.detail == "Invalid authentication credentials"
+        mock_validate.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_accepts_tab_separated_bearer_header(self):
+        """Accepts any whitespace between the scheme and the token."""
+        request = MagicMock()
+        request.headers.get.return_value = "Bearer\tsbk_valid_token"
+        db = MagicMock()
+
+        expected_user = User(
+            id=uuid.uuid4(),
+            email="svc@example.com",
+            role=UserRole.SERVICE_ACCOUNT,
+        )
+
+        with patch(
+            "app.features.user.manager.validate_token",
+            return_value=expected_user,
+        ) as mock_validate:
+            result = await current_active_user(request=request, oauth_user=None, db=db)
+
+        assert result is expected_user
+        mock_validate.assert_called_once_with("sbk_valid_token", db)
+
     @pytest.mark.asyncio
     async def test_raises_401_for_invalid_token(self):
         """Raises 401 when token validation fails."""
@@ -201,6 +252,31 @@ class TestCurrentActiveUser:
 
         assert result is expected_user
 
+    @pytest.mark.asyncio
+    async def test_validates_token_off_the_event_loop_thread(self):
+        """Token validation runs on a worker thread, not the event loop."""
+        request = MagicMock()
+        request.headers.get.return_value = "Bearer sbk_valid_token"
+        db = MagicMock()
+        loop_thread = threading.get_ident()
+        validation_threads: list[int] = []
+
+        def fake_validate_token(raw_token, session):
+            validation_threads.append(threading.get_ident())
+            return User(
+                id=uuid.uuid4(),
+                email="svc@example.com",
+                role=UserRole.SERVICE_ACCOUNT,
+            )
+
+        with patch(
+            "app.features.user.manager.validate_token",
+            side_effect=fake_validate_token,
+        ):
+            await current_active_user(request=request, oauth_user=None, db=db)
+
+        assert validation_threads and validation_threads[0] != loop_thread
+
 
 class TestOptionalCurrentUser:
     @pytest.mark.asyncio
@@ -229,6 +305,23 @@ class TestOptionalCurrentUser:
 
         assert result is None
 
+    @pytest.mark.asyncio
+    async def test_skips_threadpool_when_no_auth_header(self):
+        request = MagicMock()
+        request.headers.get.return_value = None
+        db = MagicMock()
+
+        with patch(
+            "app.features.user.manager.run_in_threadpool",
+            new_callable=AsyncMock,
+        ) as mock_run_in_threadpool:
+            result = await optional_current_user(
+                request=request, oauth_user=None, db=db
+            )
+
+        assert result is None
+        mock_run_in_threadpool.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_returns_user_for_valid_token(self):
         request = MagicMock()
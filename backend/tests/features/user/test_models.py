@@ -23,7 +23,7 @@ class TestApiToken:
         api_token = ApiToken(
             id=token_id,
             name="test-token",
-            token_hash="abc123",
+            token_hash=b"abc123",
             user_id=user_id,
         )
         expected_repr = f"<ApiToken id={token_id} name='test-token' user_id={user_id}>"
@@ -0,0 +1,72 @@
+import httpx
+import pytest
+
+from app.scripts.users.provision_service_account import (
+    _api_request,
+    login_and_get_token,
+)
+
+BASE_URL = "http://simboard.example.com"
+
+
+def _client(handler) -> httpx.Client:
+    return httpx.Client(transport=httpx.MockTransport(handler))
+
+
+def _redirect(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(
+        307, headers={"Location": str(request.url.copy_with(scheme="https"))}
+    )
+
+
+def _unauthorized(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(401, json={"detail": "LOGIN_BAD_CREDENTIALS"})
+
+
+class TestLoginAndGetToken:
+    def test_returns_access_token(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"access_token": "jwt-token"})
+
+        with _client(handler) as client:
+            token = login_and_get_token(client, BASE_URL, "admin@example.com", "pw")
+
+        assert token == "jwt-token"
+
+    @pytest.mark.parametrize(
+        ("handler", "status_code"), [(_redirect, 307), (_unauthorized, 401)]
+    )
+    def test_exits_on_non_success_response(
+        self, handler, status_code: int, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        with _client(handler) as client, pytest.raises(SystemExit) as exc_info:
+            login_and_get_token(client, BASE_URL, "admin@example.com", "pw")
+
+        assert exc_info.value.code == 1
+        assert f"Authentication failed ({status_code})" in capsys.readouterr().err
+
+    def test_exits_on_connection_error(
+        self, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("connection refused", request=request)
+
+        with _client(handler) as client, pytest.raises(SystemExit) as exc_info:
+            login_and_get_token(client, BASE_URL, "admin@example.com", "pw")
+
+        assert exc_info.value.code == 1
+        assert "Connection failed" in capsys.readouterr().err
+
+
+class TestApiRequest:
+    @pytest.mark.parametrize(
+        ("handler", "status_code"), [(_redirect, 307), (_unauthorized, 401)]
+    )
+    def test_exits_on_non_success_response(
+        self, handler, status_code: int, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        with _client(handler) as client, pytest.raises(SystemExit) as exc_info:
+            _api_request(client, f"{BASE_URL}/api/v1/tokens", "jwt-token", {})
+
+        assert exc_info.value.code == 1
+        assert f"API error ({status_code})" in capsys.readouterr().err